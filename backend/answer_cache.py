@@ -0,0 +1,114 @@
+"""
+AI Answer Cache
+Caches BioMuseum Intelligence answers by normalized question, with an
+in-process hot tier in front of a MongoDB collection that expires via TTL index
+"""
+
+import hashlib
+import logging
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Questions that normalize to fewer characters than this are never cached
+MIN_QUESTION_CHARS = 4
+
+
+def normalize_question(question: str) -> str:
+    """
+    Fold case, punctuation and whitespace in any script: 'What is DNA?' -> 'what is dna'.
+    Letters, digits and combining marks (e.g. Devanagari vowel signs) are kept.
+    """
+    text = unicodedata.normalize("NFKC", question or "").casefold()
+    kept = "".join(c if unicodedata.category(c)[0] in "LNM" else " " for c in text)
+    return " ".join(kept.split())
+
+
+def question_key(question: str) -> Optional[str]:
+    """Cache key for a question, or None if it is too short to cache safely"""
+    normalized = normalize_question(question)
+    if len(normalized.replace(" ", "")) < MIN_QUESTION_CHARS:
+        return None
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class AnswerCache:
+    """Two-tier (memory, MongoDB) cache of chatbot answers"""
+
+    def __init__(self, collection=None, ttl_seconds: int = 7 * 24 * 3600, hot_size: int = 512):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        self.hot = TTLCache(maxsize=hot_size, ttl_seconds=ttl_seconds)
+        self.db_hits = 0
+        self.misses = 0
+
+    async def get(self, question: str) -> Optional[Dict]:
+        """Cached answer or None; database errors count as a miss"""
+        key = question_key(question)
+        if key is None:
+            return None
+        answer = self.hot.get(key)
+        if answer is not None:
+            return answer
+
+        if self.collection is not None:
+            try:
+                doc = await self.collection.find_one(
+                    {"key": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+                    {"_id": 0, "answer": 1, "expires_at": 1}
+                )
+            except Exception as e:
+                logger.warning(f"AI answer cache lookup failed: {e}")
+                doc = None
+            if doc:
+                self.db_hits += 1
+                expires_at = doc["expires_at"]
+                if expires_at.tzinfo is None:
+                    expires_at = expires_at.replace(tzinfo=timezone.utc)
+                remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+                self.hot.set(key, doc["answer"], ttl_seconds=max(1.0, remaining))
+                return doc["answer"]
+
+        self.misses += 1
+        return None
+
+    async def set(self, question: str, answer: Dict) -> None:
+        """Store an answer; never raises, a failed write only loses the cache entry"""
+        key = question_key(question)
+        if key is None:
+            return
+        self.hot.set(key, answer)
+        if self.collection is None:
+            return
+
+        now = datetime.now(timezone.utc)
+        try:
+            await self.collection.update_one(
+                {"key": key},
+                {"$set": {
+                    "key": key,
+                    "question": normalize_question(question),
+                    "answer": answer,
+                    "created_at": now,
+                    "expires_at": now + timedelta(seconds=self.ttl_seconds),
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"AI answer cache write failed: {e}")
+
+    def stats(self) -> Dict:
+        hot_hits = self.hot.hits
+        lookups = hot_hits + self.db_hits + self.misses
+        return {
+            "hot_hits": hot_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round((hot_hits + self.db_hits) / lookups, 4) if lookups else 0.0,
+            "hot_size": len(self.hot),
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -0,0 +1,126 @@
+"""
+Materialized BioTube Taxonomy Facets
+Per-value video counts and the kingdom -> phylum -> class -> species tree
+for the BioTube filter bar, kept in memory and updated on every video write
+"""
+
+import hashlib
+import json
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from search_filter import VIDEO_TAXONOMY_FIELDS
+
+# Fields to fetch from MongoDB when (re)building the facets
+FACETS_PROJECTION = {"_id": 0, "id": 1, "visibility": 1, **{field: 1 for field in VIDEO_TAXONOMY_FIELDS}}
+
+# Legacy response keys holding the sorted distinct values of each field
+LEGACY_KEYS = {"kingdom": "kingdoms", "phylum": "phylums", "class_name": "classes", "species": "species"}
+
+TaxonomyPath = Tuple[str, ...]
+
+
+def video_path(video: Dict) -> Optional[TaxonomyPath]:
+    """Taxonomy values of a public video (None for private ones)"""
+    if video.get("visibility", "public") != "public":
+        return None
+    return tuple(str(video.get(field) or "").strip() for field in VIDEO_TAXONOMY_FIELDS)
+
+
+class TaxonomyFacets:
+    """
+    Counts of public videos per taxonomy path. The response document and its
+    ETag are rendered once per change and then served as-is.
+    """
+
+    def __init__(self, max_age_seconds: float = 300):
+        self.max_age_seconds = max_age_seconds
+        self.built_at: Optional[float] = None
+        self._paths: Counter = Counter()
+        self._by_video: Dict[str, TaxonomyPath] = {}
+        self._rendered: Optional[Tuple[bytes, str]] = None
+
+    @property
+    def is_stale(self) -> bool:
+        """True if never built or older than max_age_seconds (picks up writes made by other processes)"""
+        if self.built_at is None:
+            return True
+        return time.monotonic() - self.built_at > self.max_age_seconds
+
+    def rebuild(self, videos: Iterable[Dict]) -> int:
+        """Replace the facets with the given videos; returns the number of public videos counted"""
+        self._paths = Counter()
+        self._by_video = {}
+        for video in videos:
+            self.apply(video)
+        self.built_at = time.monotonic()
+        return len(self._by_video)
+
+    def apply(self, video: Dict) -> None:
+        """Count a newly written or updated video (the full document), replacing its previous values"""
+        video_id = video.get("id")
+        if not video_id:
+            return
+        self.remove(video_id)
+        path = video_path(video)
+        if path is None:
+            return
+        self._by_video[video_id] = path
+        self._paths[path] += 1
+        self._rendered = None
+
+    def remove(self, video_id: str) -> None:
+        path = self._by_video.pop(video_id, None)
+        if path is None:
+            return
+        self._paths[path] -= 1
+        if self._paths[path] <= 0:
+            del self._paths[path]
+        self._rendered = None
+
+    def render(self) -> Tuple[bytes, str]:
+        """(JSON body, ETag) for the filters endpoint"""
+        if self._rendered is None:
+            body = json.dumps(self._document(), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            self._rendered = (body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+        return self._rendered
+
+    def _document(self) -> Dict:
+        counts: Dict[str, Counter] = {field: Counter() for field in VIDEO_TAXONOMY_FIELDS}
+        for path, count in self._paths.items():
+            for field, value in zip(VIDEO_TAXONOMY_FIELDS, path):
+                if value:
+                    counts[field][value] += count
+
+        document = {LEGACY_KEYS[field]: sorted(counts[field]) for field in VIDEO_TAXONOMY_FIELDS}
+        document["counts"] = {field: dict(sorted(counts[field].items())) for field in VIDEO_TAXONOMY_FIELDS}
+        document["tree"] = self._tree()
+        document["total"] = len(self._by_video)
+        return document
+
+    def _tree(self) -> List[Dict]:
+        """
+        Nested [{value, count, children}] drill-down. A video is counted down
+        to its first missing rank, so counts at each level add up.
+        """
+        root: Dict = {}
+        for path, count in self._paths.items():
+            level = root
+            for value in path:
+                if not value:
+                    break
+                node = level.setdefault(value, {"count": 0, "children": {}})
+                node["count"] += count
+                level = node["children"]
+
+        def to_list(level: Dict) -> List[Dict]:
+            return [
+                {"value": value, "count": node["count"], "children": to_list(node["children"])}
+                for value, node in sorted(level.items())
+            ]
+
+        return to_list(root)
+
+    def __len__(self) -> int:
+        return len(self._by_video)
@@ -0,0 +1,209 @@
+"""
+MongoDB Index Registry
+Declares the indexes every collection needs and creates them idempotently
+
+Usage:
+    python db_indexes.py ensure   # create any missing indexes
+    python db_indexes.py report   # list missing, unregistered and unused indexes
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from dotenv import load_dotenv
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+
+def _unique_id() -> IndexModel:
+    return IndexModel([("id", ASCENDING)], name="id_unique", unique=True)
+
+
+# collection name -> indexes it must have. Names are stable so re-running is a no-op.
+INDEX_REGISTRY: Dict[str, List[IndexModel]] = {
+    "organisms": [
+        _unique_id(),
+        IndexModel([("qr_code_id", ASCENDING)], name="qr_code_id_unique", unique=True),
+        IndexModel([("created_at", ASCENDING), ("id", ASCENDING)], name="created_at_id"),
+        IndexModel(
+            [("kingdom_lc", ASCENDING), ("phylum_lc", ASCENDING), ("class_lc", ASCENDING), ("species_lc", ASCENDING)],
+            name="taxonomy_lc"
+        ),
+        # Duplicate detection: one organism per normalized name
+        IndexModel(
+            [("name_key", ASCENDING)], name="name_key_unique", unique=True,
+            partialFilterExpression={"name_key": {"$gt": ""}}
+        ),
+        IndexModel([("scientific_name_key", ASCENDING)], name="scientific_name_key"),
+    ],
+    "suggestions": [
+        _unique_id(),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)], name="status_created_at"),
+    ],
+    "biotube_videos": [
+        _unique_id(),
+        IndexModel([("youtube_url", ASCENDING)], name="youtube_url_unique", unique=True),
+        # Keyset paging of the video lists: newest first by (created_at, id)
+        IndexModel([("visibility", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="visibility_created_at_id"),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at_id"),
+        IndexModel(
+            [
+                ("visibility", ASCENDING),
+                ("kingdom_lc", ASCENDING),
+                ("phylum_lc", ASCENDING),
+                ("class_name_lc", ASCENDING),
+                ("species_lc", ASCENDING),
+                ("created_at", DESCENDING),
+            ],
+            name="visibility_taxonomy_lc_created_at"
+        ),
+    ],
+    "video_suggestions": [
+        _unique_id(),
+        IndexModel([("status", ASCENDING), ("created_at", DESCENDING)], name="status_created_at"),
+        IndexModel([("user_name", ASCENDING), ("created_at", DESCENDING)], name="user_name_created_at"),
+    ],
+    "related_videos": [
+        IndexModel([("video_id", ASCENDING)], name="video_id_unique", unique=True),
+        IndexModel([("kingdom_lc", ASCENDING)], name="kingdom_lc"),
+    ],
+    "video_comments": [
+        _unique_id(),
+        IndexModel([("video_id", ASCENDING), ("created_at", DESCENDING)], name="video_id_created_at"),
+    ],
+    "blogs": [
+        _unique_id(),
+        IndexModel([("visibility", ASCENDING), ("created_at", DESCENDING)], name="visibility_created_at"),
+    ],
+    "blog_suggestions": [
+        _unique_id(),
+        IndexModel([("created_at", DESCENDING)], name="created_at"),
+    ],
+    "qr_assets": [
+        _unique_id(),
+    ],
+    "ai_answer_cache": [
+        IndexModel([("key", ASCENDING)], name="key_unique", unique=True),
+        # MongoDB removes entries once expires_at has passed
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+    "jobs": [
+        _unique_id(),
+        IndexModel(
+            [("idempotency_key", ASCENDING)], name="idempotency_key_unique", unique=True,
+            partialFilterExpression={"idempotency_key": {"$exists": True}}
+        ),
+        # Only queued jobs carry a coalesce key; claiming a job removes it
+        IndexModel(
+            [("coalesce_key", ASCENDING)], name="coalesce_key_unique", unique=True,
+            partialFilterExpression={"coalesce_key": {"$exists": True}}
+        ),
+        IndexModel([("status", ASCENDING), ("run_after", ASCENDING)], name="status_run_after"),
+        # Finished jobs are removed once their retention period (expires_at) has passed
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+    "image_validations": [
+        IndexModel([("key", ASCENDING)], name="key_unique", unique=True),
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+    "gmail_users": [
+        _unique_id(),
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("login_timestamp", DESCENDING)], name="login_timestamp"),
+    ],
+}
+
+
+async def ensure_indexes(db) -> Dict[str, List[str]]:
+    """
+    Create every registered index that does not exist yet.
+    Each index is created separately so one failure (e.g. duplicate values
+    blocking a unique index) is logged without skipping the rest.
+    Returns {collection: [index names that could not be created]}.
+    """
+    failures: Dict[str, List[str]] = {}
+    for collection_name, models in INDEX_REGISTRY.items():
+        collection = db[collection_name]
+        for model in models:
+            name = model.document["name"]
+            try:
+                await collection.create_indexes([model])
+            except OperationFailure as e:
+                logger.warning(f"Could not create index {collection_name}.{name}: {e}")
+                failures.setdefault(collection_name, []).append(name)
+    return failures
+
+
+async def index_report(db) -> Dict[str, Dict]:
+    """
+    Compare the registry with what exists in the database.
+
+    Returns, per collection:
+        missing       - registered indexes that do not exist
+        unregistered  - existing indexes not in the registry (besides _id_)
+        unused        - existing indexes with zero recorded accesses, or None
+                        if $indexStats is not permitted on this cluster
+    """
+    report: Dict[str, Dict] = {}
+    for collection_name, models in INDEX_REGISTRY.items():
+        collection = db[collection_name]
+        registered = {model.document["name"] for model in models}
+        existing = set((await collection.index_information()).keys())
+
+        unused = None
+        try:
+            stats = await collection.aggregate([{"$indexStats": {}}]).to_list(None)
+            unused = sorted(
+                s["name"] for s in stats
+                if s["name"] != "_id_" and s.get("accesses", {}).get("ops", 0) == 0
+            )
+        except Exception as e:
+            logger.debug(f"$indexStats unavailable for {collection_name}: {e}")
+
+        report[collection_name] = {
+            "missing": sorted(registered - existing),
+            "unregistered": sorted(existing - registered - {"_id_"}),
+            "unused": unused,
+        }
+    return report
+
+
+async def _main(command: str) -> int:
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    load_dotenv(Path(__file__).parent / '.env')
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ.get('DB_NAME', 'biomuseum')]
+
+    try:
+        if command == "ensure":
+            failures = await ensure_indexes(db)
+            for collection_name, names in failures.items():
+                print(f"[WARN] {collection_name}: could not create {', '.join(names)}")
+            print("[OK] Index registry applied" if not failures else "[WARN] Index registry applied with failures")
+            return 1 if failures else 0
+
+        report = await index_report(db)
+        for collection_name, entry in report.items():
+            print(f"{collection_name}:")
+            print(f"  missing:      {', '.join(entry['missing']) or '-'}")
+            print(f"  unregistered: {', '.join(entry['unregistered']) or '-'}")
+            unused = entry['unused']
+            print(f"  unused:       {'n/a' if unused is None else (', '.join(unused) or '-')}")
+        return 0
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "report"
+    if command not in ("ensure", "report"):
+        print("Usage: python db_indexes.py [ensure|report]")
+        sys.exit(2)
+    sys.exit(asyncio.run(_main(command)))
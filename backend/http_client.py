@@ -0,0 +1,127 @@
+"""
+Shared Async HTTP Client
+One pooled, keep-alive httpx client for every outbound call (Unsplash,
+Wikimedia, Bing, image downloads) with per-host concurrency limits,
+timeouts and retry with exponential backoff
+"""
+
+import asyncio
+import logging
+import random
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AsyncHTTPClient:
+    """Pooled async HTTP client with per-host concurrency limits and retries"""
+
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        per_host_limit: int = 6,
+        max_retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        self.per_host_limit = per_host_limit
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            follow_redirects=True,
+            headers={"User-Agent": "BioMuseum/1.0"},
+        )
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return semaphore
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Delay before retry `attempt` (1-based), honouring Retry-After when given"""
+        if response is not None:
+            retry_after = response.headers.get("retry-after", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        delay = self.backoff_base * (2 ** (attempt - 1))
+        return min(delay, self.backoff_max) * (0.5 + random.random() / 2)
+
+    async def request(self, method: str, url: str, retries: Optional[int] = None, **kwargs) -> httpx.Response:
+        """
+        Send a request, retrying transport errors and RETRY_STATUS_CODES with
+        exponential backoff. The last response is returned even if it is an
+        error status; the last transport error is raised if every attempt fails.
+        """
+        retries = self.max_retries if retries is None else retries
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with self._semaphore(url):
+                    response = await self._client.request(method, url, **kwargs)
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                if attempt > retries:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {url[:80]} failed ({e!r}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status_code in RETRY_STATUS_CODES and attempt <= retries:
+                delay = self._backoff(attempt, response)
+                logger.warning(f"{method} {url[:80]} returned {response.status_code}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            return response
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs):
+        """Stream a response body (no retries) while holding the per-host slot"""
+        async with self._semaphore(url):
+            async with self._client.stream(method, url, **kwargs) as response:
+                yield response
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+_shared_client: Optional[AsyncHTTPClient] = None
+
+
+def get_http_client() -> AsyncHTTPClient:
+    """Process-wide shared client, created on first use"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = AsyncHTTPClient()
+    return _shared_client
+
+
+async def close_http_client() -> None:
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
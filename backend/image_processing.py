@@ -0,0 +1,123 @@
+"""
+Image Fetching and Preprocessing for Vision Validation
+Streams candidate images with a byte cap and content-type check, then
+decodes and downscales them in a worker process before they are sent to Gemini
+"""
+
+import asyncio
+import io
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Tuple
+
+from PIL import Image
+
+from http_client import get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Largest image body we are willing to download for validation
+MAX_IMAGE_BYTES = int(os.environ.get('IMAGE_MAX_BYTES', str(8 * 1024 * 1024)))
+
+# Longest side (pixels) of the image sent to the vision model
+VALIDATION_IMAGE_SIZE = int(os.environ.get('VALIDATION_IMAGE_SIZE', '512'))
+
+VALIDATION_JPEG_QUALITY = 85
+
+# Decoded size limit; a small compressed file can still expand to gigabytes of pixels
+MAX_IMAGE_PIXELS = int(os.environ.get('IMAGE_MAX_PIXELS', str(40_000_000)))
+Image.MAX_IMAGE_PIXELS = MAX_IMAGE_PIXELS
+
+
+class ImageFetchError(Exception):
+    """The image could not be downloaded or decoded"""
+
+
+async def fetch_image_bytes(url: str, max_bytes: int = MAX_IMAGE_BYTES) -> Tuple[bytes, str]:
+    """
+    Stream an image into memory, aborting as soon as the response turns out
+    not to be an image or grows past max_bytes. Returns (body, content_type).
+    """
+    async with get_http_client().stream("GET", url) as response:
+        if response.status_code != 200:
+            raise ImageFetchError(f"HTTP {response.status_code}")
+
+        content_type = response.headers.get('content-type', '').split(';')[0].strip().lower()
+        if content_type and not content_type.startswith('image/'):
+            raise ImageFetchError(f"Not an image ({content_type})")
+
+        declared = response.headers.get('content-length', '')
+        if declared.isdigit() and int(declared) > max_bytes:
+            raise ImageFetchError(f"Image too large ({int(declared)} bytes)")
+
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes():
+            buffer.extend(chunk)
+            if len(buffer) > max_bytes:
+                raise ImageFetchError(f"Image exceeds {max_bytes} bytes")
+
+    return bytes(buffer), content_type or 'image/jpeg'
+
+
+def downscale_image(data: bytes, max_side: int = VALIDATION_IMAGE_SIZE) -> bytes:
+    """Decode an image and re-encode it as a JPEG no larger than max_side (runs in a worker process)"""
+    with Image.open(io.BytesIO(data)) as img:
+        # Only the header has been read so far, so this rejects decompression bombs before decoding
+        if img.width * img.height > MAX_IMAGE_PIXELS:
+            raise ImageFetchError(f"Image too large ({img.width}x{img.height} pixels)")
+        # Lets the JPEG decoder skip full-resolution decoding where it can
+        img.draft('RGB', (max_side, max_side))
+        img = img.convert('RGB')
+        img.thumbnail((max_side, max_side))
+
+        output = io.BytesIO()
+        img.save(output, format='JPEG', quality=VALIDATION_JPEG_QUALITY, optimize=True)
+        return output.getvalue()
+
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_image_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=int(os.environ.get('IMAGE_WORKERS', '2')))
+    return _process_pool
+
+
+def _replace_broken_pool(broken: ProcessPoolExecutor) -> None:
+    """Drop a pool whose worker died (unless another caller already replaced it)"""
+    global _process_pool
+    if _process_pool is broken:
+        _process_pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+
+async def prepare_for_vision(data: bytes, max_side: int = VALIDATION_IMAGE_SIZE) -> Tuple[bytes, str]:
+    """Downscaled JPEG bytes and mime type ready to send to the vision model"""
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = get_image_process_pool()
+        try:
+            jpeg = await loop.run_in_executor(pool, downscale_image, data, max_side)
+            break
+        except BrokenProcessPool as e:
+            # A worker was killed (e.g. out of memory); every later submit would fail until the pool is recreated
+            logger.warning(f"Image worker pool broken, recreating it: {e}")
+            _replace_broken_pool(pool)
+            if attempt:
+                raise ImageFetchError(f"Could not decode image: {e}")
+        except ImageFetchError:
+            raise
+        except Exception as e:
+            raise ImageFetchError(f"Could not decode image: {e}")
+    return jpeg, 'image/jpeg'
+
+
+def shutdown_image_workers() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
@@ -0,0 +1,47 @@
+"""
+Image Search Result Cache
+Remembers the image URLs each provider (Unsplash, Wikimedia, Bing, ...)
+returned for a query, so repeated lookups do not spend rate-limited API calls
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from search_index import fold_text
+from ttl_cache import TTLCache
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """'  Bengal  TIGER ' -> 'bengal tiger'"""
+    return _WHITESPACE_RE.sub(" ", fold_text(query or "")).strip()
+
+
+class ImageSearchCache:
+    """TTL + LRU cache of image search results keyed by (provider, normalized query, count)"""
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: int = 6 * 3600):
+        self._cache = TTLCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def key(provider: str, query: str, count: int) -> Tuple[str, str, int]:
+        return (provider, normalize_query(query), count)
+
+    def get(self, provider: str, query: str, count: int) -> Optional[List[str]]:
+        urls = self._cache.get(self.key(provider, query, count))
+        return list(urls) if urls is not None else None
+
+    def set(self, provider: str, query: str, count: int, urls: List[str]) -> None:
+        self._cache.set(self.key(provider, query, count), tuple(urls))
+
+    def stats(self) -> Dict:
+        return self._cache.stats()
+
+
+# Shared by every image search helper in the process
+image_search_cache = ImageSearchCache(
+    maxsize=int(os.environ.get('IMAGE_SEARCH_CACHE_SIZE', '1024')),
+    ttl_seconds=int(os.environ.get('IMAGE_SEARCH_CACHE_TTL', str(6 * 3600))),
+)
@@ -0,0 +1,361 @@
+"""
+Image Sourcing Engine
+One async entry point for organism image search over pluggable providers
+(Unsplash, Wikimedia Commons, Bing, iStock), each behind its own rate
+limiter and circuit breaker, with results shared through image_search_cache
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+
+from http_client import get_http_client
+from image_search_cache import image_search_cache, normalize_query
+from single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderUnavailableError(Exception):
+    """The provider answered with an error status or could not be reached"""
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` calls per `per` seconds"""
+
+    def __init__(self, rate: int, per: float):
+        self.capacity = max(1, rate)
+        self.refill_per_second = rate / per
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_second)
+        self.updated = now
+
+    async def acquire(self, max_wait: float = 2.0) -> bool:
+        """Take a token, waiting at most max_wait seconds; False if none became available"""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                wait = (1 - self.tokens) / self.refill_per_second
+                if wait > max_wait:
+                    return False
+                await asyncio.sleep(wait)
+                self._refill()
+            self.tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """
+    Stops calling a provider after `failure_threshold` consecutive failures.
+    After `reset_timeout` seconds one trial call is let through (half-open);
+    its outcome closes the circuit again or re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def release(self) -> None:
+        """Give back a half-open trial that ended without reaching the provider"""
+        self._trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class ImageProvider:
+    """Base class: subclasses implement _search() and may override is_configured()"""
+
+    name = "provider"
+
+    def __init__(self, rate_limiter: RateLimiter, breaker: Optional[CircuitBreaker] = None):
+        self.rate_limiter = rate_limiter
+        self.breaker = breaker or CircuitBreaker()
+        # Identical searches already on the wire are shared, not repeated
+        self._flight = SingleFlight(memo_ttl=0)
+
+    def is_configured(self) -> bool:
+        return True
+
+    async def search(self, query: str, count: int) -> List[str]:
+        """Cached, rate-limited, circuit-broken search; never raises"""
+        if not query or not self.is_configured():
+            return []
+
+        cached = image_search_cache.get(self.name, query, count)
+        if cached is not None:
+            return cached
+
+        return await self._flight.do(
+            image_search_cache.key(self.name, query, count),
+            lambda: self._search_live(query, count)
+        )
+
+    async def _search_live(self, query: str, count: int) -> List[str]:
+        if not self.breaker.allow():
+            logger.info(f"{self.name} circuit open, skipping search for '{query}'")
+            return []
+        if not await self.rate_limiter.acquire():
+            logger.warning(f"{self.name} rate limit reached, skipping search for '{query}'")
+            self.breaker.release()
+            return []
+
+        try:
+            urls = await self._search(query, count)
+        except (ProviderUnavailableError, httpx.HTTPError) as e:
+            self.breaker.record_failure()
+            logger.warning(f"{self.name} search failed for '{query}': {e}")
+            return []
+        except Exception as e:
+            self.breaker.record_failure()
+            logger.warning(f"Error searching {self.name} for '{query}': {e}")
+            return []
+
+        self.breaker.record_success()
+        urls = list(dict.fromkeys(urls))[:count]
+        if urls:
+            image_search_cache.set(self.name, query, count, urls)
+        logger.info(f"{self.name}: {len(urls)} images for '{query}'")
+        return urls
+
+    async def _search(self, query: str, count: int) -> List[str]:
+        raise NotImplementedError
+
+    def status(self) -> Dict:
+        return {
+            "configured": self.is_configured(),
+            "circuit": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "tokens": round(self.rate_limiter.tokens, 2),
+        }
+
+
+def _check_status(provider: str, response: httpx.Response) -> None:
+    if response.status_code != 200:
+        raise ProviderUnavailableError(f"{provider} returned status {response.status_code}")
+
+
+class UnsplashProvider(ImageProvider):
+    name = "unsplash"
+    API_URL = "https://api.unsplash.com/search/photos"
+
+    def is_configured(self) -> bool:
+        return bool(os.getenv("UNSPLASH_ACCESS_KEY"))
+
+    async def _search(self, query: str, count: int) -> List[str]:
+        response = await get_http_client().get(
+            self.API_URL,
+            headers={
+                'Authorization': f'Client-ID {os.getenv("UNSPLASH_ACCESS_KEY")}',
+                'Accept-Version': 'v1'
+            },
+            params={
+                'query': query,
+                'per_page': min(max(count, 1), 30),
+                'order_by': 'relevant'
+            }
+        )
+        _check_status(self.name, response)
+
+        images = []
+        for photo in response.json().get('results', []):
+            # Regular size with quality parameters: good balance between quality and size
+            img_url = photo.get('urls', {}).get('regular', '')
+            if img_url:
+                images.append(img_url + ('&' if '?' in img_url else '?') + 'w=800&q=90')
+        return images
+
+
+class WikimediaProvider(ImageProvider):
+    name = "wikimedia"
+    API_URL = "https://commons.wikimedia.org/w/api.php"
+
+    async def _search(self, query: str, count: int) -> List[str]:
+        response = await get_http_client().get(
+            self.API_URL,
+            params={
+                'action': 'query',
+                'list': 'allimages',
+                'aisort': 'timestamp',
+                'aidir': 'descending',
+                'aifrom': query,
+                'ailimit': max(count, 10),
+                'format': 'json'
+            }
+        )
+        _check_status(self.name, response)
+
+        data = response.json()
+        return [img['url'] for img in data.get('query', {}).get('allimages', []) if 'url' in img]
+
+
+class BingProvider(ImageProvider):
+    """
+    Bing Image Search API (provides Google Images-like results).
+
+    Setup:
+    1. Go to https://www.microsoft.com/en-us/bing/apis/bing-image-search-api
+    2. Create Azure account
+    3. Get free tier: 1,000 requests/month
+    4. Add key to .env as BING_SEARCH_API_KEY
+    """
+
+    name = "bing"
+    API_URL = "https://api.bing.microsoft.com/v7.0/images/search"
+
+    def is_configured(self) -> bool:
+        return bool(os.environ.get('BING_SEARCH_API_KEY'))
+
+    async def _search(self, query: str, count: int) -> List[str]:
+        response = await get_http_client().get(
+            self.API_URL,
+            headers={"Ocp-Apim-Subscription-Key": os.environ.get('BING_SEARCH_API_KEY')},
+            params={
+                "q": query,
+                "count": count,
+                "imageType": "Photo",
+                "aspect": "Square",
+                "safeSearch": "Strict"
+            }
+        )
+        _check_status(self.name, response)
+        return [img["contentUrl"] for img in response.json().get("value", []) if img.get("contentUrl")]
+
+
+class IStockProvider(ImageProvider):
+    """
+    iStock API (premium). Requires ISTOCK_API_KEY and ISTOCK_API_SECRET.
+    The API needs an OAuth2 setup that is not implemented yet, so this
+    provider returns no images.
+    https://www.istockphoto.com/contribute/api-documentation
+    """
+
+    name = "istock"
+
+    def is_configured(self) -> bool:
+        return bool(os.environ.get('ISTOCK_API_KEY') and os.environ.get('ISTOCK_API_SECRET'))
+
+    async def _search(self, query: str, count: int) -> List[str]:
+        logger.info("iStock integration not yet implemented")
+        return []
+
+
+def fallback_search_terms(organism_name: str) -> List[str]:
+    """Organism name, its first word if multi-word, then generic nature terms"""
+    terms = [organism_name]
+    if ' ' in organism_name.strip():
+        terms.append(organism_name.split()[0])
+    terms.extend(["animal", "nature", "wildlife"])
+    return terms
+
+
+# Providers tried, in order, when collecting images for an organism
+ORGANISM_IMAGE_PROVIDERS = ("unsplash", "wikimedia", "bing")
+
+
+def _rate_from_env(name: str, default: str) -> RateLimiter:
+    """RateLimiter from an env value such as '50/3600' (calls per seconds)"""
+    calls, _, seconds = os.environ.get(name, default).partition('/')
+    return RateLimiter(int(calls), float(seconds or 1))
+
+
+class ImageSourcingEngine:
+    """Registry of providers plus the multi-term / multi-provider search used by the endpoints"""
+
+    def __init__(self, providers: Iterable[ImageProvider]):
+        self.providers: Dict[str, ImageProvider] = {provider.name: provider for provider in providers}
+
+    def provider(self, name: str) -> ImageProvider:
+        return self.providers[name]
+
+    async def search(self, provider: str, query: str, count: int) -> List[str]:
+        """Images for one query from one provider"""
+        return await self.providers[provider].search(query, count)
+
+    async def find_images(
+        self,
+        terms: Sequence[str],
+        count: int,
+        providers: Sequence[str] = ("unsplash",)
+    ) -> List[str]:
+        """
+        Walk search terms in order, trying each provider in order, and collect
+        unique image URLs until `count` are found. Terms that normalize to the
+        same query are only searched once.
+        """
+        images: List[str] = []
+        seen_terms = set()
+        for term in terms:
+            query = normalize_query(term)
+            if not query or query in seen_terms:
+                continue
+            seen_terms.add(query)
+
+            for name in providers:
+                if len(images) >= count:
+                    return images
+                for url in await self.search(name, term, count):
+                    if url not in images and len(images) < count:
+                        images.append(url)
+        return images
+
+    def configured(self, names: Sequence[str] = ORGANISM_IMAGE_PROVIDERS) -> Tuple[str, ...]:
+        """The given providers, in order, minus those without credentials"""
+        return tuple(name for name in names if name in self.providers and self.providers[name].is_configured())
+
+    def status(self) -> Dict[str, Dict]:
+        return {name: provider.status() for name, provider in self.providers.items()}
+
+
+_shared_engine: Optional[ImageSourcingEngine] = None
+
+
+def get_image_engine() -> ImageSourcingEngine:
+    """Process-wide engine; provider rate limits come from *_RATE_LIMIT env vars ('calls/seconds')"""
+    global _shared_engine
+    if _shared_engine is None:
+        _shared_engine = ImageSourcingEngine([
+            # Unsplash demo apps are limited to 50 requests/hour
+            UnsplashProvider(_rate_from_env('UNSPLASH_RATE_LIMIT', '50/3600')),
+            WikimediaProvider(_rate_from_env('WIKIMEDIA_RATE_LIMIT', '100/60')),
+            BingProvider(_rate_from_env('BING_RATE_LIMIT', '3/1')),
+            IStockProvider(_rate_from_env('ISTOCK_RATE_LIMIT', '10/60')),
+        ])
+    return _shared_engine
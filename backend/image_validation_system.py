@@ -15,21 +15,122 @@ Implementation Note:
 
 import asyncio
 import base64
-import requests
+import hashlib
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+import os
+from typing import Awaitable, Iterable, List, Dict, Optional
+from datetime import datetime, timedelta, timezone
 import json
 
-# For vision validation - using existing Gemini setup
-try:
-    import google.generativeai as genai
-    HAS_GENAI = True
-except ImportError:
-    HAS_GENAI = False
+from pymongo import UpdateOne
+
+from image_processing import fetch_image_bytes, prepare_for_vision
+from image_sources import get_image_engine
+from llm_executor import HAS_GENAI, get_llm_executor
+from search_index import fold_text
+from ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Minimum vision confidence for an image to be accepted
+CONFIDENCE_THRESHOLD = 70
+
+# Batched vision requests in flight per search
+VALIDATION_CONCURRENCY = int(os.environ.get('IMAGE_VALIDATION_CONCURRENCY', '4'))
+
+# Candidate images judged together in one Gemini request
+VALIDATION_BATCH_SIZE = max(1, int(os.environ.get('IMAGE_VALIDATION_BATCH_SIZE', '4')))
+
+# ============================================================================
+# VALIDATION VERDICT CACHE
+# ============================================================================
+
+def verdict_key(image_ref: str, organism_name: str, scientific_name: str = "") -> str:
+    """Cache key for a verdict; image_ref is an image URL or a 'sha256:<hex>' content hash"""
+    subject = f"{fold_text(organism_name)}|{fold_text(scientific_name)}"
+    return hashlib.sha256(f"{image_ref}|{subject}".encode()).hexdigest()
+
+
+def content_ref(image_bytes: bytes) -> str:
+    return f"sha256:{hashlib.sha256(image_bytes).hexdigest()}"
+
+
+class ValidationVerdictCache:
+    """
+    Vision verdicts keyed by (image URL or content hash, organism, scientific name).
+    Recent verdicts are held in memory; all are persisted to MongoDB, which
+    drops them after ttl_seconds through a TTL index on expires_at.
+    """
+
+    def __init__(self, collection=None, ttl_seconds: int = 30 * 24 * 3600, hot_size: int = 2048):
+        self.collection = collection
+        self.ttl_seconds = ttl_seconds
+        self.hot = TTLCache(maxsize=hot_size, ttl_seconds=ttl_seconds)
+
+    async def get(self, image_ref: str, organism_name: str, scientific_name: str = "") -> Optional[Dict]:
+        verdicts = await self.get_many([image_ref], organism_name, scientific_name)
+        return verdicts.get(image_ref)
+
+    async def get_many(self, image_refs: Iterable[str], organism_name: str, scientific_name: str = "") -> Dict[str, Dict]:
+        """Bulk lookup: {image_ref: verdict} for every ref that has already been judged"""
+        found: Dict[str, Dict] = {}
+        missing: Dict[str, str] = {}
+        for ref in image_refs:
+            key = verdict_key(ref, organism_name, scientific_name)
+            verdict = self.hot.get(key)
+            if verdict is not None:
+                found[ref] = verdict
+            else:
+                missing[key] = ref
+
+        if missing and self.collection is not None:
+            try:
+                cursor = self.collection.find(
+                    {"key": {"$in": list(missing)}, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+                    {"_id": 0, "key": 1, "verdict": 1}
+                )
+                async for doc in cursor:
+                    self.hot.set(doc["key"], doc["verdict"])
+                    found[missing[doc["key"]]] = doc["verdict"]
+            except Exception as e:
+                logger.warning(f"Verdict cache lookup failed: {e}")
+
+        return {ref: {**verdict, "cached": True} for ref, verdict in found.items()}
+
+    async def put(self, image_refs: Iterable[str], organism_name: str, scientific_name: str, verdict: Dict) -> None:
+        """Store one verdict under every ref (URL and content hash) it applies to"""
+        verdict = {k: v for k, v in verdict.items() if k != "cached"}
+        now = datetime.now(timezone.utc)
+        operations = []
+        for ref in image_refs:
+            key = verdict_key(ref, organism_name, scientific_name)
+            self.hot.set(key, verdict)
+            operations.append(UpdateOne(
+                {"key": key},
+                {"$set": {
+                    "key": key,
+                    "image_ref": ref,
+                    "organism_name": organism_name,
+                    "scientific_name": scientific_name,
+                    "verdict": verdict,
+                    "created_at": now,
+                    "expires_at": now + timedelta(seconds=self.ttl_seconds),
+                }},
+                upsert=True
+            ))
+
+        if operations and self.collection is not None:
+            try:
+                await self.collection.bulk_write(operations, ordered=False)
+            except Exception as e:
+                logger.warning(f"Verdict cache write failed: {e}")
+
+
+# The collection is attached at startup (see server.init_mongodb)
+verdict_cache = ValidationVerdictCache(
+    ttl_seconds=int(os.environ.get('IMAGE_VERDICT_CACHE_TTL', str(30 * 24 * 3600)))
+)
+
 # ============================================================================
 # IMAGE VALIDATION FUNCTIONS
 # ============================================================================
@@ -70,9 +171,87 @@ async def validate_image_with_ai(image_url: str, organism_name: str, scientific_
         logger.warning("Gemini API not available, skipping validation")
         return {"is_valid": True, "confidence": 75, "reason": "Validation unavailable", "cached": False}
     
+    cached = await verdict_cache.get(image_url, organism_name, scientific_name)
+    if cached is not None:
+        return cached
+    
+    try:
+        candidate = await _prepare_candidate(image_url, organism_name, scientific_name)
+        if "verdict" in candidate:
+            return candidate["verdict"]
+        return await _judge_single(candidate, organism_name, scientific_name)
+    
+    except Exception as e:
+        logger.error(f"Image validation error: {e}")
+        return _unjudged_verdict(e)
+
+
+async def validate_images_batch(image_urls: List[str], organism_name: str, scientific_name: str = "") -> Dict[str, Dict]:
+    """
+    Validate several candidate images of one organism with a single Gemini request.
+    
+    Returns {url: verdict} in the same shape as validate_image_with_ai. Images
+    the model's answer does not cover (or all of them, if it cannot be parsed)
+    are re-checked one per request. If the call itself fails (busy, timeout,
+    API error) nothing is retried and every image is returned as not judged.
+    """
+    image_urls = list(dict.fromkeys(image_urls))
+    if not HAS_GENAI:
+        logger.warning("Gemini API not available, skipping validation")
+        return {url: {"is_valid": True, "confidence": 75, "reason": "Validation unavailable", "cached": False}
+                for url in image_urls}
+    
+    verdicts = await verdict_cache.get_many(image_urls, organism_name, scientific_name)
+    todo = [url for url in image_urls if url not in verdicts]
+    
+    ready = []
+    for candidate in await asyncio.gather(*(_prepare_candidate(url, organism_name, scientific_name) for url in todo)):
+        if "verdict" in candidate:
+            verdicts[candidate["url"]] = candidate["verdict"]
+        else:
+            ready.append(candidate)
+    
+    if len(ready) == 1:
+        verdicts[ready[0]["url"]] = await _judge_single_safely(ready[0], organism_name, scientific_name)
+        return verdicts
+    if not ready:
+        return verdicts
+    
     try:
-        # Create validation prompt
-        prompt = f"""You are an expert biologist. Analyze this image and determine if it shows the organism: {organism_name}
+        contents = [_batch_prompt(organism_name, scientific_name, len(ready))]
+        for number, candidate in enumerate(ready, start=1):
+            contents.extend([f"Image {number}:", candidate["part"]])
+        response = await get_llm_executor().generate_content('gemini-2.0-flash', contents)
+        response_text = response.text
+    except Exception as e:
+        # Retrying each image separately would only multiply calls into an overloaded or failing service
+        logger.error(f"Batched image validation failed: {e}")
+        for candidate in ready:
+            verdicts[candidate["url"]] = _unjudged_verdict(e)
+        return verdicts
+    
+    parsed = _parse_batch_response(response_text, len(ready))
+    
+    leftovers = []
+    for number, candidate in enumerate(ready, start=1):
+        if number in parsed:
+            verdict = _verdict_from_result(parsed[number])
+            await verdict_cache.put([candidate["url"], candidate["hash"]], organism_name, scientific_name, verdict)
+            verdicts[candidate["url"]] = verdict
+        else:
+            leftovers.append(candidate)
+    
+    if leftovers:
+        logger.warning(f"Batch verdicts missing for {len(leftovers)}/{len(ready)} images, validating individually")
+        singles = await asyncio.gather(*(_judge_single_safely(c, organism_name, scientific_name) for c in leftovers))
+        for candidate, verdict in zip(leftovers, singles):
+            verdicts[candidate["url"]] = verdict
+    
+    return verdicts
+
+
+def _single_prompt(organism_name: str, scientific_name: str) -> str:
+    return f"""You are an expert biologist. Analyze this image and determine if it shows the organism: {organism_name}
         
 Scientific name: {scientific_name if scientific_name else "N/A"}
 
@@ -88,214 +267,275 @@ IMPORTANT: Be strict but fair. If it's clearly a different organism, confidence
 If it shows the right type but maybe wrong species, medium confidence.
 Only high confidence if you're very sure it's the correct organism."""
 
-        # Download and encode image for Gemini Vision
+
+def _batch_prompt(organism_name: str, scientific_name: str, image_count: int) -> str:
+    return f"""You are an expert biologist. You are given {image_count} numbered images. For EACH image, determine if it shows the organism: {organism_name}
+
+Scientific name: {scientific_name if scientific_name else "N/A"}
+
+Respond in JSON format ONLY, with one entry per image:
+[
+    {{
+        "image": number (1 to {image_count}),
+        "is_organism": boolean (true if this is clearly the organism or very similar),
+        "confidence": number (0-100, where 100 is absolutely certain this is {organism_name}),
+        "reason": "brief explanation of what you see in the image",
+        "characteristics_found": ["list", "of", "identifying", "characteristics"]
+    }}
+]
+
+IMPORTANT: Judge every image independently. Be strict but fair. If it's clearly a different organism, confidence should be low.
+If it shows the right type but maybe wrong species, medium confidence.
+Only high confidence if you're very sure it's the correct organism."""
+
+
+def _verdict_from_result(result: Dict) -> Dict:
+    return {
+        "is_valid": result.get("is_organism", False),
+        "confidence": result.get("confidence", 50),
+        "reason": result.get("reason", "Unable to determine"),
+        "cached": False,
+        "characteristics": result.get("characteristics_found", [])
+    }
+
+
+def _parse_batch_response(response_text: str, image_count: int) -> Dict[int, Dict]:
+    """{image number: raw result} for every well-formed entry; empty if unparseable"""
+    try:
+        start_idx = response_text.find('[')
+        end_idx = response_text.rfind(']') + 1
+        results = json.loads(response_text[start_idx:end_idx])
+    except (json.JSONDecodeError, ValueError):
+        logger.error(f"Failed to parse batched Gemini response: {response_text[:200]}")
+        return {}
+    
+    parsed = {}
+    for result in results if isinstance(results, list) else []:
+        if not isinstance(result, dict):
+            continue
         try:
-            img_response = requests.get(image_url, timeout=10)
-            if img_response.status_code != 200:
-                return {
-                    "is_valid": False,
-                    "confidence": 0,
-                    "reason": "Could not download image",
-                    "cached": False
-                }
-            
-            # Encode to base64 for Gemini
-            image_data = base64.standard_b64encode(img_response.content).decode("utf-8")
-            
-            # Determine image type
-            content_type = img_response.headers.get('content-type', 'image/jpeg')
-            if 'png' in content_type:
-                mime_type = "image/png"
-            elif 'gif' in content_type:
-                mime_type = "image/gif"
-            elif 'webp' in content_type:
-                mime_type = "image/webp"
-            else:
-                mime_type = "image/jpeg"
-            
-        except Exception as e:
-            logger.error(f"Failed to download image for validation: {e}")
-            return {
-                "is_valid": False,
-                "confidence": 0,
-                "reason": f"Image download failed: {str(e)}",
-                "cached": False
-            }
-        
-        # Send to Gemini Vision
-        model = genai.GenerativeModel('gemini-2.0-flash')
-        response = model.generate_content([
-            prompt,
-            {
-                "mime_type": mime_type,
-                "data": image_data,
-            }
-        ])
+            number = int(result.get("image"))
+        except (TypeError, ValueError):
+            continue
+        if 1 <= number <= image_count:
+            parsed[number] = result
+    return parsed
+
+
+async def _prepare_candidate(image_url: str, organism_name: str, scientific_name: str) -> Dict:
+    """
+    Download and shrink one image for the vision model.
+    Returns {"url", "hash", "part"}, or {"url", "verdict"} when no model call is
+    needed (download failed, or the same image content was already judged).
+    """
+    try:
+        # Stream the image (capped, images only) and shrink it for Gemini Vision
+        image_bytes, _ = await fetch_image_bytes(image_url)
         
-        # Parse response
-        response_text = response.text
+        # The same picture is often served from several URLs
+        image_hash = content_ref(image_bytes)
+        cached = await verdict_cache.get(image_hash, organism_name, scientific_name)
+        if cached is not None:
+            await verdict_cache.put([image_url], organism_name, scientific_name, cached)
+            return {"url": image_url, "verdict": cached}
         
-        # Extract JSON from response
-        try:
-            # Try to find JSON in response
-            import json
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            json_str = response_text[start_idx:end_idx]
-            validation_result = json.loads(json_str)
-            
-            return {
-                "is_valid": validation_result.get("is_organism", False),
-                "confidence": validation_result.get("confidence", 50),
-                "reason": validation_result.get("reason", "Unable to determine"),
-                "cached": False,
-                "characteristics": validation_result.get("characteristics_found", [])
-            }
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse Gemini response: {response_text}")
-            return {
+        thumbnail, mime_type = await prepare_for_vision(image_bytes)
+        del image_bytes
+    
+    except Exception as e:
+        logger.error(f"Failed to download image for validation: {e}")
+        return {
+            "url": image_url,
+            "verdict": {
                 "is_valid": False,
-                "confidence": 50,
-                "reason": "Validation response parsing failed",
+                "confidence": 0,
+                "reason": f"Image download failed: {str(e)}",
                 "cached": False
             }
+        }
     
-    except Exception as e:
-        logger.error(f"Image validation error: {e}")
-        return {
-            "is_valid": True,  # Assume valid on error to not break flow
-            "confidence": 70,
-            "reason": f"Validation error: {str(e)}",
-            "cached": False
+    return {
+        "url": image_url,
+        "hash": image_hash,
+        "part": {
+            "mime_type": mime_type,
+            "data": base64.standard_b64encode(thumbnail).decode("utf-8"),
         }
+    }
 
 
-async def search_unsplash_with_validation(organism_name: str, count: int = 6) -> List[Dict]:
-    """
-    Search Unsplash and validate each image.
+async def _judge_single(candidate: Dict, organism_name: str, scientific_name: str) -> Dict:
+    """One Gemini Vision request for one prepared image"""
+    response = await get_llm_executor().generate_content('gemini-2.0-flash', [
+        _single_prompt(organism_name, scientific_name),
+        candidate["part"]
+    ])
     
-    Returns:
-        [
-            {
-                "url": "image_url",
-                "source": "unsplash",
-                "confidence": 85,
-                "validation_reason": "..."
-            }
-        ]
-    """
-    from server import search_unsplash_images  # Import existing function
+    # Parse response
+    response_text = response.text
     
+    # Extract JSON from response
     try:
-        # Get raw images from Unsplash (existing function)
-        image_urls = search_unsplash_images(organism_name, count=count * 2)  # Get more to filter
-        
-        validated_images = []
-        
-        for url in image_urls:
-            if len(validated_images) >= count:
-                break
-            
-            # Validate each image
-            validation = await validate_image_with_ai(url, organism_name)
-            
-            # Accept if confidence > 70%
-            if validation.get("confidence", 0) >= 70:
-                validated_images.append({
-                    "url": url,
-                    "source": "unsplash",
-                    "confidence": validation.get("confidence", 75),
-                    "validation_reason": validation.get("reason", "Valid organism image"),
-                    "characteristics": validation.get("characteristics", [])
-                })
-        
-        return validated_images
+        start_idx = response_text.find('{')
+        end_idx = response_text.rfind('}') + 1
+        validation_result = json.loads(response_text[start_idx:end_idx])
+    except json.JSONDecodeError:
+        logger.error(f"Failed to parse Gemini response: {response_text}")
+        return {
+            "is_valid": False,
+            "confidence": 50,
+            "reason": "Validation response parsing failed",
+            "cached": False
+        }
     
+    verdict = _verdict_from_result(validation_result)
+    # Only real model verdicts are cached; download/parse failures are retried next time
+    await verdict_cache.put([candidate["url"], candidate["hash"]], organism_name, scientific_name, verdict)
+    return verdict
+
+
+async def _judge_single_safely(candidate: Dict, organism_name: str, scientific_name: str) -> Dict:
+    try:
+        return await _judge_single(candidate, organism_name, scientific_name)
     except Exception as e:
-        logger.error(f"Unsplash search with validation failed: {e}")
-        return []
+        logger.error(f"Image validation error: {e}")
+        return _unjudged_verdict(e)
 
 
-async def search_istock_images(organism_name: str, count: int = 6) -> List[str]:
+def _unjudged_verdict(error: Exception) -> Dict:
+    """Verdict for an image the model never judged: rejected, and not cached so it is checked next time"""
+    return {
+        "is_valid": False,
+        "confidence": 0,
+        "reason": f"Validation error: {str(error)}",
+        "cached": False,
+        "judged": False
+    }
+
+
+def _accepted_image(url: str, source: str, validation: Dict) -> Dict:
+    return {
+        "url": url,
+        "source": source,
+        "confidence": validation.get("confidence", 75),
+        "validation_reason": validation.get("reason", "Valid organism image"),
+        "characteristics": validation.get("characteristics", []),
+        "cached": validation.get("cached", False)
+    }
+
+
+async def fan_out_validation(
+    providers: Dict[str, Awaitable[List[str]]],
+    organism_name: str,
+    scientific_name: str = "",
+    count: Optional[int] = None,
+    concurrency: Optional[int] = None
+) -> List[Dict]:
     """
-    Search iStock API for organism images.
+    Run every provider search concurrently and validate candidates in batches
+    of VALIDATION_BATCH_SIZE as soon as each provider answers, at most
+    `concurrency` batched vision calls at a time.
     
-    NOTE: Requires ISTOCK_API_KEY and ISTOCK_API_SECRET environment variables
-    
-    iStock API Documentation:
-    https://www.istockphoto.com/contribute/api-documentation
+    Candidates are validated in the order they were discovered, previously
+    judged URLs reuse their stored verdict, and once `count` images have
+    cleared CONFIDENCE_THRESHOLD all outstanding searches and validations
+    are cancelled.
     """
+    semaphore = asyncio.Semaphore(concurrency or VALIDATION_CONCURRENCY)
+    accepted: List[Dict] = []
+    seen = set()
+    
+    def satisfied() -> bool:
+        return count is not None and len(accepted) >= count
+    
+    def consider(url: str, source: str, validation: Dict) -> None:
+        if validation.get("confidence", 0) >= CONFIDENCE_THRESHOLD and not satisfied():
+            accepted.append(_accepted_image(url, source, validation))
+    
+    async def judge(urls: List[str], source: str) -> None:
+        async with semaphore:
+            if satisfied():
+                return
+            verdicts = await validate_images_batch(urls, organism_name, scientific_name)
+        for url in urls:
+            consider(url, source, verdicts[url])
+    
+    searches = {asyncio.ensure_future(search): source for source, search in providers.items()}
+    pending = set(searches)
     try:
-        ISTOCK_API_KEY = os.environ.get('ISTOCK_API_KEY')
-        ISTOCK_API_SECRET = os.environ.get('ISTOCK_API_SECRET')
-        
-        if not ISTOCK_API_KEY or not ISTOCK_API_SECRET:
-            logger.debug("iStock API credentials not configured")
-            return []
-        
-        # iStock API implementation
-        # This would require OAuth2 setup - for now, returning empty
-        # In production, implement full iStock API integration
-        
-        logger.info("iStock integration not yet implemented")
-        return []
+        while pending and not satisfied():
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                source = searches.get(task)
+                if source is None:
+                    if not task.cancelled() and task.exception() is not None:
+                        logger.error(f"Image validation task failed: {task.exception()}")
+                    continue
+                
+                if task.exception() is not None:
+                    logger.error(f"{source} image search failed: {task.exception()}")
+                    continue
+                urls = [url for url in task.result() if url not in seen]
+                seen.update(urls)
+                
+                known = await verdict_cache.get_many(urls, organism_name, scientific_name)
+                if known:
+                    logger.info(f"{len(known)}/{len(urls)} {source} images already judged for {organism_name}")
+                for url in urls:
+                    if url in known:
+                        consider(url, source, known[url])
+                
+                unjudged = [url for url in urls if url not in known]
+                for i in range(0, len(unjudged), VALIDATION_BATCH_SIZE):
+                    if satisfied():
+                        break
+                    pending.add(asyncio.ensure_future(judge(unjudged[i:i + VALIDATION_BATCH_SIZE], source)))
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
     
-    except Exception as e:
-        logger.error(f"iStock search failed: {e}")
-        return []
+    return accepted
 
 
-async def search_bing_images(organism_name: str, count: int = 6) -> List[str]:
-    """
-    Search Bing Image Search API for organism images (provides Google Images results).
+async def validate_candidates(
+    urls: List[str],
+    organism_name: str,
+    scientific_name: str = "",
+    source: str = "unsplash",
+    count: Optional[int] = None
+) -> List[Dict]:
+    """Validate an already-fetched candidate list concurrently; see fan_out_validation"""
+    async def candidates() -> List[str]:
+        return urls
     
-    NOTE: Requires BING_SEARCH_API_KEY environment variable
+    return await fan_out_validation({source: candidates()}, organism_name, scientific_name, count)
+
+
+async def search_unsplash_with_validation(organism_name: str, count: int = 6, scientific_name: str = "") -> List[Dict]:
+    """
+    Search Unsplash and validate each image.
     
-    Setup:
-    1. Go to https://www.microsoft.com/en-us/bing/apis/bing-image-search-api
-    2. Create Azure account
-    3. Get free tier: 1,000 requests/month
-    4. Add key to .env as BING_SEARCH_API_KEY
+    Returns:
+        [
+            {
+                "url": "image_url",
+                "source": "unsplash",
+                "confidence": 85,
+                "validation_reason": "..."
+            }
+        ]
     """
     try:
-        BING_API_KEY = os.environ.get('BING_SEARCH_API_KEY')
-        
-        if not BING_API_KEY:
-            logger.debug("Bing Search API key not configured")
-            return []
-        
-        headers = {"Ocp-Apim-Subscription-Key": BING_API_KEY}
-        params = {
-            "q": organism_name,
-            "count": count,
-            "imageType": "Photo",
-            "aspect": "Square",
-            "safeSearch": "Strict"
-        }
-        
-        response = requests.get(
-            "https://api.bing.microsoft.com/v7.0/images/search",
-            headers=headers,
-            params=params,
-            timeout=10
+        # Get more raw images than needed so rejected ones can be replaced
+        return await fan_out_validation(
+            {"unsplash": get_image_engine().search("unsplash", organism_name, count * 2)},
+            organism_name, scientific_name, count
         )
-        
-        if response.status_code != 200:
-            logger.error(f"Bing API error: {response.status_code}")
-            return []
-        
-        data = response.json()
-        image_urls = []
-        
-        for img in data.get("value", [])[:count]:
-            url = img.get("contentUrl")
-            if url:
-                image_urls.append(url)
-        
-        return image_urls
     
     except Exception as e:
-        logger.error(f"Bing image search failed: {e}")
+        logger.error(f"Unsplash search with validation failed: {e}")
         return []
 
 
@@ -308,11 +548,10 @@ async def search_images_with_validation(
     Main orchestration function: Multi-stage image search with AI validation.
     
     Pipeline:
-    1. Try Unsplash (free, fast)
-    2. If insufficient results, try iStock (premium)
-    3. If still insufficient, try Bing (web search)
-    4. Validate all images with AI
-    5. Return best matches sorted by confidence
+    1. Search Unsplash (free, fast), iStock (premium) and Bing (web search) concurrently
+    2. Validate candidates with AI as each provider answers, a few at a time
+    3. Stop and cancel outstanding work once `count` images are accepted
+    4. Return best matches sorted by confidence
     
     Returns:
         {
@@ -331,51 +570,20 @@ async def search_images_with_validation(
     """
     
     try:
-        all_images = []
-        sources_used = []
+        engine = get_image_engine()
         
-        # STAGE 1: Try Unsplash first (free)
-        logger.info(f"[1/3] Searching Unsplash for {organism_name}...")
-        unsplash_images = await search_unsplash_with_validation(organism_name, count=count)
-        all_images.extend(unsplash_images)
-        if unsplash_images:
-            sources_used.append("unsplash")
-        
-        # STAGE 2: If need more, try iStock (premium)
-        if len(all_images) < count:
-            logger.info(f"[2/3] Searching iStock for {organism_name}...")
-            istock_urls = await search_istock_images(organism_name, count=count - len(all_images))
-            
-            for url in istock_urls:
-                validation = await validate_image_with_ai(url, organism_name, scientific_name)
-                if validation.get("confidence", 0) >= 70:
-                    all_images.append({
-                        "url": url,
-                        "source": "istock",
-                        "confidence": validation.get("confidence", 75),
-                        "validation_reason": validation.get("reason", "Valid organism image")
-                    })
-            
-            if istock_urls and len(all_images) > len(unsplash_images):
-                sources_used.append("istock")
-        
-        # STAGE 3: If still need more, try Bing
-        if len(all_images) < count:
-            logger.info(f"[3/3] Searching Bing for {organism_name}...")
-            bing_urls = await search_bing_images(organism_name, count=count - len(all_images))
-            
-            for url in bing_urls:
-                validation = await validate_image_with_ai(url, organism_name, scientific_name)
-                if validation.get("confidence", 0) >= 70:
-                    all_images.append({
-                        "url": url,
-                        "source": "bing",
-                        "confidence": validation.get("confidence", 75),
-                        "validation_reason": validation.get("reason", "Valid organism image")
-                    })
-            
-            if bing_urls and len(all_images) > len(unsplash_images):
-                sources_used.append("bing")
+        # All providers start at once; the fallbacks are speculative and get
+        # cancelled as soon as enough images have been accepted
+        logger.info(f"Searching Unsplash, iStock and Bing for {organism_name}...")
+        all_images = await fan_out_validation(
+            {
+                "unsplash": engine.search("unsplash", organism_name, count * 2),
+                "istock": engine.search("istock", organism_name, count),
+                "bing": engine.search("bing", organism_name, count),
+            },
+            organism_name, scientific_name, count
+        )
+        sources_used = list(dict.fromkeys(image["source"] for image in all_images))
         
         # Sort by confidence (best first)
         all_images.sort(key=lambda x: x.get("confidence", 0), reverse=True)
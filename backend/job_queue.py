@@ -0,0 +1,296 @@
+"""
+Durable Background Job Queue
+MongoDB-backed jobs run by worker coroutines, with retries and exponential
+backoff, idempotency keys, coalescing of repeated requests and lease-based
+recovery of jobs whose worker died
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot help (bad input, missing record, ...)"""
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobQueue:
+    """
+    Jobs live in one collection:
+        {id, type, payload, status, attempts, max_attempts, run_after,
+         locked_by, locked_until, result, error, idempotency_key,
+         coalesce_key, created_at, started_at, finished_at, expires_at}
+
+    Workers claim the oldest due job atomically. A running job whose lease
+    has expired (its worker crashed or was restarted) is claimed again.
+    """
+
+    def __init__(
+        self,
+        collection=None,
+        workers: int = 2,
+        poll_interval: float = 2.0,
+        lease_seconds: float = 300.0,
+        backoff_base: float = 5.0,
+        backoff_max: float = 300.0,
+        idempotency_window: float = 600.0,
+        retention_seconds: float = 7 * 24 * 3600,
+    ):
+        self.collection = collection
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.idempotency_window = idempotency_window
+        self.retention_seconds = retention_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._handlers: Dict[str, JobHandler] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def register(self, job_type: str, handler: JobHandler) -> None:
+        self._handlers[job_type] = handler
+
+    async def enqueue(
+        self,
+        job_type: str,
+        payload: Dict[str, Any],
+        idempotency_key: Optional[str] = None,
+        max_attempts: int = 3,
+        coalesce_key: Optional[str] = None,
+        delay_seconds: float = 0,
+    ) -> Dict:
+        """
+        Queue a job and return its document. With an idempotency key, a job
+        with the same key that is still pending, or finished successfully
+        within idempotency_window, is returned instead of queueing a new one.
+
+        A coalesce key only merges requests while the job is still queued:
+        once a worker claims it the key is released, so a request arriving
+        during or after the run queues a fresh job. Combined with
+        delay_seconds this folds a burst of requests into a single run.
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        if idempotency_key:
+            existing = await self._find_reusable(idempotency_key)
+            if existing:
+                return existing
+
+        if coalesce_key:
+            existing = await self.collection.find_one({"coalesce_key": coalesce_key, "status": QUEUED}, {"_id": 0})
+            if existing:
+                return existing
+
+        now = _utcnow()
+        job = {
+            "id": str(uuid.uuid4()),
+            "type": job_type,
+            "payload": payload,
+            "status": QUEUED,
+            "attempts": 0,
+            "max_attempts": max_attempts,
+            "run_after": now + timedelta(seconds=delay_seconds),
+            "locked_by": None,
+            "locked_until": None,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "started_at": None,
+            "finished_at": None,
+        }
+        if idempotency_key:
+            job["idempotency_key"] = idempotency_key
+        if coalesce_key:
+            job["coalesce_key"] = coalesce_key
+
+        try:
+            await self.collection.insert_one(job)
+        except DuplicateKeyError:
+            # Another request queued the same key first
+            if idempotency_key:
+                existing = await self.collection.find_one({"idempotency_key": idempotency_key}, {"_id": 0})
+            else:
+                existing = await self.collection.find_one({"coalesce_key": coalesce_key}, {"_id": 0})
+            if existing:
+                return existing
+            raise
+
+        job.pop("_id", None)
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return job
+
+    async def _find_reusable(self, idempotency_key: str) -> Optional[Dict]:
+        existing = await self.collection.find_one({"idempotency_key": idempotency_key}, {"_id": 0})
+        if not existing:
+            return None
+        if existing["status"] in (QUEUED, RUNNING):
+            return existing
+
+        finished_at = existing.get("finished_at")
+        if finished_at is not None and finished_at.tzinfo is None:
+            finished_at = finished_at.replace(tzinfo=timezone.utc)
+        if (existing["status"] == SUCCEEDED and finished_at is not None
+                and (_utcnow() - finished_at).total_seconds() < self.idempotency_window):
+            return existing
+
+        # Failed or stale: release the key so a fresh job can take it
+        await self.collection.update_one({"id": existing["id"]}, {"$unset": {"idempotency_key": ""}})
+        return None
+
+    async def get(self, job_id: str) -> Optional[Dict]:
+        return await self.collection.find_one({"id": job_id}, {"_id": 0})
+
+    async def _claim(self) -> Optional[Dict]:
+        now = _utcnow()
+        job = await self.collection.find_one_and_update(
+            {
+                "type": {"$in": list(self._handlers)},
+                "$or": [
+                    {"status": QUEUED, "run_after": {"$lte": now}},
+                    {"status": RUNNING, "locked_until": {"$lt": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "status": RUNNING,
+                    "locked_by": self.worker_id,
+                    "locked_until": now + timedelta(seconds=self.lease_seconds),
+                    "started_at": now,
+                },
+                # Requests made from now on must not be merged into a run that may already have read its data
+                "$unset": {"coalesce_key": ""},
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_after", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if job is not None:
+            job.pop("_id", None)
+        return job
+
+    def _backoff(self, attempts: int) -> float:
+        return min(self.backoff_base * (2 ** max(0, attempts - 1)), self.backoff_max)
+
+    async def _execute(self, job: Dict) -> None:
+        handler = self._handlers[job["type"]]
+        try:
+            result = await asyncio.wait_for(handler(job["payload"]), self.lease_seconds)
+        except asyncio.CancelledError:
+            # Shutting down: leave the job for the next worker once the lease expires
+            raise
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            permanent = isinstance(e, PermanentJobError)
+            if permanent or job["attempts"] >= job["max_attempts"]:
+                logger.error(f"Job {job['id']} ({job['type']}) failed after {job['attempts']} attempt(s): {error}")
+                await self._finish(job, FAILED, error=error)
+            else:
+                delay = self._backoff(job["attempts"])
+                logger.warning(f"Job {job['id']} ({job['type']}) attempt {job['attempts']} failed, retrying in {delay:g}s: {error}")
+                await self.collection.update_one(
+                    {"id": job["id"], "locked_by": self.worker_id},
+                    {"$set": {
+                        "status": QUEUED,
+                        "error": error,
+                        "run_after": _utcnow() + timedelta(seconds=delay),
+                        "locked_by": None,
+                        "locked_until": None,
+                    }}
+                )
+            return
+
+        await self._finish(job, SUCCEEDED, result=result)
+
+    async def _finish(self, job: Dict, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        now = _utcnow()
+        await self.collection.update_one(
+            {"id": job["id"], "locked_by": self.worker_id},
+            {"$set": {
+                "status": status,
+                "result": result,
+                "error": error,
+                "finished_at": now,
+                "locked_by": None,
+                "locked_until": None,
+                "expires_at": now + timedelta(seconds=self.retention_seconds),
+            }}
+        )
+
+    async def _worker(self, number: int) -> None:
+        while True:
+            try:
+                job = await self._claim()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {number} could not claim a job: {e}")
+                job = None
+
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            logger.info(f"Job worker {number} running {job['type']} job {job['id']} (attempt {job['attempts']})")
+            try:
+                await self._execute(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job worker {number} crashed on job {job['id']}: {e}")
+
+    def start(self) -> None:
+        if self._tasks or self.collection is None:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+def public_job(job: Dict) -> Dict:
+    """Job document as returned by the status endpoint"""
+    return {
+        "job_id": job["id"],
+        "type": job["type"],
+        "status": job["status"],
+        "attempts": job.get("attempts", 0),
+        "max_attempts": job.get("max_attempts"),
+        "result": job.get("result"),
+        "error": job.get("error"),
+        "created_at": job.get("created_at"),
+        "started_at": job.get("started_at"),
+        "finished_at": job.get("finished_at"),
+    }
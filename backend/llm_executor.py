@@ -0,0 +1,132 @@
+"""
+LLM Execution Layer
+Runs the blocking Gemini SDK calls on a bounded worker pool so a slow
+generation never blocks the event loop, with queue limits and deadlines
+"""
+
+import asyncio
+import functools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+try:
+    import google.generativeai as genai
+    HAS_GENAI = True
+except ImportError:
+    HAS_GENAI = False
+    genai = None
+
+logger = logging.getLogger(__name__)
+
+
+class LLMExecutionError(Exception):
+    """Base class for failures of the execution layer itself (not of the model)"""
+    status_code = 503
+
+
+class LLMBusyError(LLMExecutionError):
+    """Too many calls are already waiting for a worker"""
+    status_code = 503
+
+
+class LLMTimeoutError(LLMExecutionError):
+    """The call did not finish before its deadline"""
+    status_code = 504
+
+
+class LLMExecutor:
+    """Bounded thread pool + semaphore in front of blocking LLM SDK calls"""
+
+    def __init__(self, max_concurrency: int = 4, max_queue: int = 32, default_timeout: float = 60.0):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.default_timeout = default_timeout
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm")
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.waiting = 0
+        self.in_flight = 0
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) on the worker pool.
+        The deadline covers both queueing and execution. If it expires the
+        caller gets LLMTimeoutError straight away; a call that is already
+        running in a thread finishes in the background and its result is
+        dropped, but it keeps its permit until the thread is actually free.
+        """
+        loop = asyncio.get_running_loop()
+        timeout = self.default_timeout if timeout is None else timeout
+        deadline = loop.time() + timeout
+
+        if self._semaphore.locked():
+            if self.waiting >= self.max_queue:
+                raise LLMBusyError("AI service is busy. Please try again in a moment.")
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            except asyncio.TimeoutError:
+                raise LLMTimeoutError(f"AI request timed out after {timeout:g}s waiting in queue")
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        try:
+            work = self._pool.submit(functools.partial(fn, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+        work.add_done_callback(lambda _: self._release_threadsafe(loop))
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(work)), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            logger.warning(f"LLM call {getattr(fn, '__name__', fn)} exceeded its {timeout:g}s deadline")
+            raise LLMTimeoutError(f"AI request timed out after {timeout:g}s")
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Done-callback of a worker future (runs in the worker thread)"""
+        try:
+            loop.call_soon_threadsafe(self._release)
+        except RuntimeError:
+            # Event loop already closed at shutdown; nothing is waiting on the permit
+            pass
+
+    async def generate_content(self, model_name: str, contents: Any, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Async equivalent of genai.GenerativeModel(model_name).generate_content(contents)"""
+        if not HAS_GENAI:
+            raise LLMExecutionError("google-generativeai is not installed")
+        return await self.run(_generate_content, model_name, contents, timeout=timeout, **kwargs)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _generate_content(model_name: str, contents: Any, **kwargs) -> Any:
+    model = genai.GenerativeModel(model_name)
+    response = model.generate_content(contents, **kwargs)
+    # Resolve .text in the worker too; it can raise for blocked responses
+    _ = response.text
+    return response
+
+
+_shared_executor: Optional[LLMExecutor] = None
+
+
+def get_llm_executor() -> LLMExecutor:
+    """Process-wide executor, sized from LLM_MAX_CONCURRENCY / LLM_MAX_QUEUE / LLM_TIMEOUT"""
+    global _shared_executor
+    if _shared_executor is None:
+        _shared_executor = LLMExecutor(
+            max_concurrency=int(os.environ.get('LLM_MAX_CONCURRENCY', '4')),
+            max_queue=int(os.environ.get('LLM_MAX_QUEUE', '32')),
+            default_timeout=float(os.environ.get('LLM_TIMEOUT', '60')),
+        )
+    return _shared_executor
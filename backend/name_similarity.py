@@ -0,0 +1,147 @@
+"""
+Near-Duplicate Organism Name Index
+Trigram index over normalized common and scientific names; candidates are
+re-ranked by edit distance so "Bengal Tigers" or "Panthera tigirs" still find
+the existing organism
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+from search_filter import normalize_name
+
+NAME_FIELDS = ("name", "scientific_name")
+
+# Candidates sharing too few trigrams with the query are not re-ranked
+MIN_TRIGRAM_SIMILARITY = 0.3
+
+# Upper bound on candidates scored with edit distance per query
+MAX_CANDIDATES = 50
+
+
+def trigrams(key: str) -> Set[str]:
+    """Padded character trigrams of a normalized name"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance (two-row dynamic programming)"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ca != cb),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def similarity(a: str, b: str) -> float:
+    """1.0 for identical strings down to 0.0, from edit distance over the longer length"""
+    longest = max(len(a), len(b))
+    if not longest:
+        return 0.0
+    return 1.0 - edit_distance(a, b) / longest
+
+
+class NameSimilarityIndex:
+    """In-memory trigram index of organism names for top-k fuzzy lookups"""
+
+    def __init__(self):
+        # trigram -> {(organism_id, field)}
+        self._postings: Dict[str, Set[Tuple[str, str]]] = {}
+        # (organism_id, field) -> (normalized key, display value, trigram count)
+        self._entries: Dict[Tuple[str, str], Tuple[str, str, int]] = {}
+        self._names: Dict[str, str] = {}
+
+    def rebuild(self, organisms: Iterable[Dict]) -> int:
+        """Replace the index contents with the given organisms"""
+        self._postings = {}
+        self._entries = {}
+        self._names = {}
+        for organism in organisms:
+            self.add(organism)
+        return len(self._names)
+
+    def add(self, organism: Dict) -> None:
+        """Index (or re-index) one organism's names"""
+        organism_id = organism.get("id")
+        if not organism_id:
+            return
+        self.remove(organism_id)
+        self._names[organism_id] = organism.get("name", "") or ""
+
+        for field in NAME_FIELDS:
+            key = normalize_name(organism.get(field))
+            if not key:
+                continue
+            grams = trigrams(key)
+            entry = (organism_id, field)
+            self._entries[entry] = (key, organism.get(field), len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(entry)
+
+    def remove(self, organism_id: str) -> None:
+        """Drop one organism's names from the index"""
+        if self._names.pop(organism_id, None) is None:
+            return
+        for field in NAME_FIELDS:
+            indexed = self._entries.pop((organism_id, field), None)
+            if indexed is None:
+                continue
+            for gram in trigrams(indexed[0]):
+                postings = self._postings.get(gram)
+                if postings is None:
+                    continue
+                postings.discard((organism_id, field))
+                if not postings:
+                    del self._postings[gram]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def similar(self, query: str, limit: int = 5, min_score: float = 0.6) -> List[Dict]:
+        """
+        Organisms whose common or scientific name is close to query, best first:
+        [{id, name, matched_field, matched_value, score}], one entry per organism.
+        """
+        key = normalize_name(query)
+        if not key:
+            return []
+
+        query_grams = trigrams(key)
+        shared: Dict[Tuple[str, str], int] = {}
+        for gram in query_grams:
+            for entry in self._postings.get(gram, ()):
+                shared[entry] = shared.get(entry, 0) + 1
+
+        # Dice coefficient on trigram sets picks the candidates worth an edit-distance pass
+        candidates = []
+        for entry, count in shared.items():
+            dice = 2 * count / (len(query_grams) + self._entries[entry][2])
+            if dice >= MIN_TRIGRAM_SIMILARITY:
+                candidates.append((dice, entry))
+        candidates.sort(reverse=True)
+
+        best: Dict[str, Dict] = {}
+        for _, entry in candidates[:MAX_CANDIDATES]:
+            organism_id, field = entry
+            indexed_key, display, _ = self._entries[entry]
+            score = round(similarity(key, indexed_key), 3)
+            if score < min_score or score <= best.get(organism_id, {}).get("score", -1):
+                continue
+            best[organism_id] = {
+                "id": organism_id,
+                "name": self._names.get(organism_id, ""),
+                "matched_field": field,
+                "matched_value": display,
+                "score": score,
+            }
+
+        ranked = sorted(best.values(), key=lambda match: (-match["score"], match["name"].lower()))
+        return ranked[:limit]
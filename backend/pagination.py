@@ -0,0 +1,89 @@
+"""
+Keyset Pagination Helpers
+Cursor-based paging and field projection for MongoDB list endpoints
+"""
+
+import base64
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(created_at: str, doc_id: str) -> str:
+    """Encode the (created_at, id) sort key of the last item into an opaque cursor"""
+    raw = json.dumps({"c": created_at, "i": doc_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode a cursor produced by encode_cursor back into (created_at, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+        return str(data["c"]), str(data["i"])
+    except Exception as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def build_keyset_query(base_query: Dict, after: Optional[str], descending: bool = False) -> Dict:
+    """
+    Extend base_query so it only matches documents after the given cursor.
+    Ordering is (created_at, id), ascending unless descending is set.
+    """
+    if not after:
+        return dict(base_query)
+
+    created_at, doc_id = decode_cursor(after)
+    op = "$lt" if descending else "$gt"
+    keyset = {
+        "$or": [
+            {"created_at": {op: created_at}},
+            {"created_at": created_at, "id": {op: doc_id}},
+        ]
+    }
+
+    if not base_query:
+        return keyset
+    return {"$and": [base_query, keyset]}
+
+
+def keyset_sort(descending: bool = False) -> List[Tuple[str, int]]:
+    """Sort specification matching build_keyset_query"""
+    direction = -1 if descending else 1
+    return [("created_at", direction), ("id", direction)]
+
+
+def build_projection(fields: Optional[str], allowed: Iterable[str]) -> Optional[Dict]:
+    """
+    Turn a comma-separated `fields=` parameter into a MongoDB projection.
+    The cursor keys (id, created_at) are always included. Returns None when no
+    projection was requested.
+    """
+    if not fields:
+        return None
+
+    requested = [f.strip() for f in fields.split(",") if f.strip()]
+    allowed = set(allowed)
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    projection = {"_id": 0, "id": 1, "created_at": 1}
+    for field in requested:
+        projection[field] = 1
+    return projection
+
+
+def split_page(docs: List[Dict], limit: Optional[int]) -> Tuple[List[Dict], Optional[str]]:
+    """
+    Split a result fetched with limit + 1 into (page, next_cursor).
+    next_cursor is None when there are no more documents.
+    """
+    if not limit or len(docs) <= limit:
+        return docs, None
+    page = docs[:limit]
+    last = page[-1]
+    return page, encode_cursor(last.get("created_at", ""), last.get("id", ""))
@@ -0,0 +1,118 @@
+"""
+QR Code Asset Store
+Renders QR codes off the event loop and stores each PNG once in MongoDB,
+so organism and video documents only keep a short asset reference
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Optional
+
+import pytz
+import qrcode
+
+# IST Timezone Configuration
+IST = pytz.timezone('Asia/Kolkata')
+
+def get_ist_now():
+    """Get current time in IST (Indian Standard Time) UTC+5:30"""
+    return datetime.now(IST).isoformat()
+
+# Assets never change once stored, so clients may cache them forever
+QR_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def render_qr_png(target_url: str, box_size: int = 10, border: int = 5) -> bytes:
+    """Render a QR code for target_url as PNG bytes (blocking - run in a thread)"""
+    qr = qrcode.QRCode(version=1, box_size=box_size, border=border)
+    qr.add_data(target_url)
+    qr.make(fit=True)
+
+    img = qr.make_image(fill_color="black", back_color="white")
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def asset_id_for_url(target_url: str, box_size: int = 10, border: int = 5) -> str:
+    """Stable asset id for a QR code rendering of target_url"""
+    return hashlib.sha256(f"qr:{box_size}:{border}:{target_url}".encode()).hexdigest()
+
+
+def asset_url(asset_id: str, base_url: str) -> str:
+    """Public URL of a stored QR asset"""
+    return f"{base_url.rstrip('/')}/api/qr/{asset_id}.png"
+
+
+def decode_data_uri(value: Optional[str]) -> Optional[bytes]:
+    """PNG bytes from a `data:image/png;base64,...` string (or bare base64), else None"""
+    if not value:
+        return None
+    try:
+        payload = value.split(',', 1)[1] if value.startswith('data:') else value
+        return base64.b64decode(payload, validate=True)
+    except Exception:
+        return None
+
+
+class QRAssetStore:
+    """Content-addressed QR PNG storage with a small in-process read cache"""
+
+    def __init__(self, collection=None, cache_size: int = 256):
+        self.collection = collection
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+    async def ensure(self, target_url: str, box_size: int = 10, border: int = 5) -> str:
+        """Return the asset id for target_url, rendering and storing the PNG on first use"""
+        asset_id = asset_id_for_url(target_url, box_size, border)
+        if asset_id in self._cache:
+            return asset_id
+        if await self.collection.find_one({"id": asset_id}, {"_id": 1}):
+            return asset_id
+
+        png = await asyncio.to_thread(render_qr_png, target_url, box_size, border)
+        await self._store(asset_id, png, target_url)
+        return asset_id
+
+    async def store_png(self, png: bytes, target_url: Optional[str] = None) -> str:
+        """Store already-rendered PNG bytes, keyed by their content hash"""
+        asset_id = hashlib.sha256(png).hexdigest()
+        if asset_id not in self._cache:
+            await self._store(asset_id, png, target_url)
+        return asset_id
+
+    async def get(self, asset_id: str) -> Optional[Dict]:
+        """Fetch an asset ({id, png, etag, ...}) by id"""
+        asset = self._cache.get(asset_id)
+        if asset is not None:
+            self._cache.move_to_end(asset_id)
+            return asset
+
+        asset = await self.collection.find_one({"id": asset_id}, {"_id": 0})
+        if asset:
+            asset["png"] = bytes(asset["png"])
+            self._remember(asset)
+        return asset
+
+    async def _store(self, asset_id: str, png: bytes, target_url: Optional[str]) -> None:
+        asset = {
+            "id": asset_id,
+            "target_url": target_url,
+            "png": png,
+            "etag": f'"{hashlib.sha256(png).hexdigest()[:32]}"',
+            "size": len(png),
+            "created_at": get_ist_now(),
+        }
+        await self.collection.update_one({"id": asset_id}, {"$setOnInsert": asset}, upsert=True)
+        self._remember(asset)
+
+    def _remember(self, asset: Dict) -> None:
+        self._cache[asset["id"]] = asset
+        self._cache.move_to_end(asset["id"])
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
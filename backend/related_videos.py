@@ -0,0 +1,141 @@
+"""
+Precomputed Related BioTube Videos
+Per-video recommendation lists scored by taxonomic closeness
+(species > class > phylum > kingdom) plus comment engagement, stored in
+MongoDB and refreshed one kingdom at a time when videos change
+"""
+
+import math
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+from pymongo import UpdateOne
+
+# Deepest shared rank decides closeness; videos must share a kingdom to be related
+RANK_WEIGHTS = (
+    ("species_lc", 4.0),
+    ("class_name_lc", 3.0),
+    ("phylum_lc", 2.0),
+    ("kingdom_lc", 1.0),
+)
+
+# Engagement adds at most this much, so it orders videos within a rank but never across ranks
+ENGAGEMENT_WEIGHT = 0.9
+
+# Fields copied into each related entry, enough to render a watch-page card
+CARD_FIELDS = ("id", "title", "thumbnail_url", "kingdom", "phylum", "class_name", "species", "created_at")
+
+VIDEO_PROJECTION = {
+    "_id": 0,
+    **{field: 1 for field in CARD_FIELDS},
+    **{field: 1 for field, _ in RANK_WEIGHTS},
+}
+
+
+def taxonomic_closeness(a: Dict, b: Dict) -> float:
+    """Weight of the deepest rank two videos share (0 when not in the same kingdom)"""
+    if (a.get("kingdom_lc") or "") != (b.get("kingdom_lc") or ""):
+        return 0.0
+    for field, weight in RANK_WEIGHTS:
+        value = a.get(field)
+        if value and value == b.get(field):
+            return weight
+    return 0.0
+
+
+def rank_related(video: Dict, candidates: Iterable[Dict], engagement: Dict[str, int], limit: int) -> List[Dict]:
+    """Top `limit` candidates for video as card entries with their score, best first"""
+    candidates = [c for c in candidates if c.get("id") != video.get("id")]
+    top_engagement = max((engagement.get(c["id"], 0) for c in candidates), default=0)
+
+    scored = []
+    for candidate in candidates:
+        closeness = taxonomic_closeness(video, candidate)
+        if not closeness:
+            continue
+        bonus = 0.0
+        if top_engagement:
+            bonus = ENGAGEMENT_WEIGHT * math.log1p(engagement.get(candidate["id"], 0)) / math.log1p(top_engagement)
+        scored.append((closeness + bonus, candidate.get("created_at", ""), candidate))
+
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    return [
+        {**{field: candidate.get(field, "") for field in CARD_FIELDS}, "score": round(score, 3)}
+        for score, _, candidate in scored[:limit]
+    ]
+
+
+class RelatedVideosStore:
+    """
+    One document per public video in the related table:
+        {video_id, kingdom_lc, related: [card + score], updated_at}
+
+    A video can only be related to videos in its own kingdom, so when a video
+    is added, changed or removed, recomputing its old and new kingdoms keeps
+    every list (including the card copies) correct.
+    """
+
+    def __init__(self, table=None, videos=None, comments=None, limit: int = 6):
+        self.table = table
+        self.videos = videos
+        self.comments = comments
+        self.limit = limit
+
+    async def get(self, video_id: str) -> Optional[List[Dict]]:
+        """Stored list for a video, or None if it has not been computed"""
+        entry = await self.table.find_one({"video_id": video_id}, {"_id": 0, "related": 1})
+        return entry["related"] if entry else None
+
+    async def compute(self, video: Dict) -> List[Dict]:
+        """Related list for one video without storing it (used for private or not yet refreshed videos)"""
+        candidates = await self._kingdom_videos(video.get("kingdom_lc") or "")
+        engagement = await self._engagement([c["id"] for c in candidates])
+        return rank_related(video, candidates, engagement, self.limit)
+
+    async def refresh_kingdoms(self, kingdoms: Optional[Iterable[str]] = None) -> int:
+        """
+        Recompute and store the lists of every public video in the given
+        kingdoms (normalized kingdom_lc values; None means all of them).
+        Returns the number of lists written.
+        """
+        if kingdoms is None:
+            kingdoms = await self.videos.distinct("kingdom_lc", {"visibility": "public"})
+            await self.table.delete_many({"kingdom_lc": {"$nin": list(kingdoms)}})
+
+        refreshed = 0
+        now = datetime.now(timezone.utc)
+        for kingdom in dict.fromkeys(k or "" for k in kingdoms):
+            videos = await self._kingdom_videos(kingdom)
+            engagement = await self._engagement([v["id"] for v in videos])
+            ops = [
+                UpdateOne(
+                    {"video_id": video["id"]},
+                    {"$set": {
+                        "kingdom_lc": kingdom,
+                        "related": rank_related(video, videos, engagement, self.limit),
+                        "updated_at": now,
+                    }},
+                    upsert=True
+                )
+                for video in videos
+            ]
+            if ops:
+                await self.table.bulk_write(ops, ordered=False)
+            # Lists of videos that were deleted, made private or moved to another kingdom
+            await self.table.delete_many({"kingdom_lc": kingdom, "video_id": {"$nin": [v["id"] for v in videos]}})
+            refreshed += len(ops)
+        return refreshed
+
+    async def _kingdom_videos(self, kingdom: str) -> List[Dict]:
+        return await self.videos.find({"visibility": "public", "kingdom_lc": kingdom}, VIDEO_PROJECTION).to_list(None)
+
+    async def _engagement(self, video_ids: List[str]) -> Dict[str, int]:
+        """Comments plus comment likes per video"""
+        if not video_ids:
+            return {}
+        pipeline = [
+            {"$match": {"video_id": {"$in": video_ids}}},
+            {"$group": {"_id": "$video_id", "comments": {"$sum": 1}, "likes": {"$sum": "$likes"}}},
+        ]
+        rows = await self.comments.aggregate(pipeline).to_list(None)
+        return {row["_id"]: row["comments"] + (row.get("likes") or 0) for row in rows}
@@ -3,11 +3,15 @@ Advanced Search and Filtering System
 Enables users to find organisms using multiple criteria
 """
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
+import bisect
+import re
 import pytz
 import uuid
 
+from search_index import fold_text
+
 # IST Timezone Configuration
 IST = pytz.timezone('Asia/Kolkata')
 
@@ -15,6 +19,119 @@ def get_ist_now():
     """Get current time in IST (Indian Standard Time) UTC+5:30"""
     return datetime.now(IST).isoformat()
 
+# Taxonomy fields that get a normalized lowercase shadow copy (e.g. kingdom -> kingdom_lc)
+ORGANISM_TAXONOMY_RANKS = ("kingdom", "phylum", "class", "order", "family", "genus", "species")
+VIDEO_TAXONOMY_FIELDS = ("kingdom", "phylum", "class_name", "species")
+
+def normalize_taxon(value) -> str:
+    """Case-fold, strip accents and collapse whitespace so exact matches can use an index"""
+    return " ".join(fold_text(str(value or "")).split())
+
+def normalize_name(value) -> str:
+    """Exact-match key for organism names: case-folded, accents stripped, whitespace collapsed"""
+    return " ".join(fold_text(str(value or "")).casefold().split())
+
+def name_key_fields(source: Dict, partial: bool = False) -> Dict:
+    """
+    Build the name_key / scientific_name_key values for an organism.
+    With partial=True only keys for fields present in source are returned (for updates).
+    """
+    source = source or {}
+    return {
+        f"{field}_key": normalize_name(source.get(field))
+        for field in ("name", "scientific_name")
+        if not partial or field in source
+    }
+
+def taxonomy_shadow_fields(source: Dict, fields, partial: bool = False) -> Dict:
+    """
+    Build the `<field>_lc` shadow values for the taxonomy fields in source.
+    With partial=True only fields present in source are returned (for updates),
+    otherwise missing fields are stored as empty strings.
+    """
+    source = source or {}
+    shadow = {}
+    for field in fields:
+        if partial and source.get(field) is None:
+            continue
+        shadow[f"{field}_lc"] = normalize_taxon(source.get(field))
+    return shadow
+
+
+class NamePrefixIndex:
+    """Sorted-array prefix index of common and scientific names for typeahead"""
+    
+    NAME_FIELDS = ("name", "organism_name", "scientific_name")
+    
+    def __init__(self):
+        # Sorted (folded_name, display_name, organism_id) tuples
+        self._entries: List[Tuple[str, str, str]] = []
+        self._by_organism: Dict[str, List[Tuple[str, str, str]]] = {}
+    
+    def rebuild(self, organisms: List[Dict]) -> int:
+        """Replace the index contents with the names of the given organisms"""
+        self._entries = []
+        self._by_organism = {}
+        for organism in organisms:
+            organism_id = organism.get('id')
+            if not organism_id:
+                continue
+            entries = self._entries_for(organism_id, organism)
+            self._by_organism[organism_id] = entries
+            self._entries.extend(entries)
+        self._entries.sort()
+        return len(self._by_organism)
+    
+    def add(self, organism: Dict) -> None:
+        """Index (or re-index) one organism's names"""
+        organism_id = organism.get('id')
+        if not organism_id:
+            return
+        self.remove(organism_id)
+        entries = self._entries_for(organism_id, organism)
+        for entry in entries:
+            bisect.insort(self._entries, entry)
+        self._by_organism[organism_id] = entries
+    
+    def remove(self, organism_id: str) -> None:
+        """Drop one organism's names from the index"""
+        for entry in self._by_organism.pop(organism_id, []):
+            idx = bisect.bisect_left(self._entries, entry)
+            if idx < len(self._entries) and self._entries[idx] == entry:
+                del self._entries[idx]
+    
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """Names starting with prefix (case and accent insensitive), alphabetically"""
+        folded = fold_text(prefix).strip()
+        if not folded:
+            return []
+        
+        suggestions = []
+        seen = set()
+        idx = bisect.bisect_left(self._entries, (folded,))
+        while idx < len(self._entries) and len(suggestions) < limit:
+            key, display, _ = self._entries[idx]
+            if not key.startswith(folded):
+                break
+            if display not in seen:
+                seen.add(display)
+                suggestions.append(display)
+            idx += 1
+        return suggestions
+    
+    def __len__(self) -> int:
+        return len(self._by_organism)
+    
+    @classmethod
+    def _entries_for(cls, organism_id: str, organism: Dict) -> List[Tuple[str, str, str]]:
+        entries = set()
+        for field in cls.NAME_FIELDS:
+            value = (organism.get(field) or '').strip()
+            if value:
+                entries.add((fold_text(value), value, organism_id))
+        return sorted(entries)
+
+
 class OrganismFilter:
     """Advanced filtering for organisms"""
     
@@ -38,21 +155,22 @@ class OrganismFilter:
         
         # Text search
         if search_term and search_term.strip():
+            pattern = re.escape(search_term.strip())
             query["$or"] = [
-                {"organism_name": {"$regex": search_term, "$options": "i"}},
-                {"scientific_name": {"$regex": search_term, "$options": "i"}},
-                {"description": {"$regex": search_term, "$options": "i"}}
+                {"organism_name": {"$regex": pattern, "$options": "i"}},
+                {"scientific_name": {"$regex": pattern, "$options": "i"}},
+                {"description": {"$regex": pattern, "$options": "i"}}
             ]
         
-        # Taxonomy filters
+        # Taxonomy filters - exact matches on the normalized shadow fields
         if kingdom:
-            query["kingdom"] = {"$regex": f"^{kingdom}$", "$options": "i"}
+            query["kingdom_lc"] = normalize_taxon(kingdom)
         if phylum:
-            query["phylum"] = {"$regex": f"^{phylum}$", "$options": "i"}
+            query["phylum_lc"] = normalize_taxon(phylum)
         if organism_class:
-            query["class"] = {"$regex": f"^{organism_class}$", "$options": "i"}
+            query["class_lc"] = normalize_taxon(organism_class)
         if species:
-            query["species"] = {"$regex": f"^{species}$", "$options": "i"}
+            query["species_lc"] = normalize_taxon(species)
         
         # Conservation status
         if endangered is not None:
@@ -79,17 +197,25 @@ class OrganismFilter:
         
         # Habitat
         if habitat:
-            query["habitat"] = {"$regex": habitat, "$options": "i"}
+            query["habitat"] = {"$regex": re.escape(habitat), "$options": "i"}
         
         return query
     
     @staticmethod
-    def get_search_suggestions(search_term: str, organisms: List[Dict]) -> List[str]:
-        """Get autocomplete suggestions"""
+    def get_search_suggestions(
+        search_term: str,
+        organisms: Optional[List[Dict]] = None,
+        index: Optional[NamePrefixIndex] = None,
+        limit: int = 10
+    ) -> List[str]:
+        """Get autocomplete suggestions, from a prebuilt NamePrefixIndex when given"""
+        if index is not None:
+            return index.suggest(search_term, limit=limit)
+        
         suggestions = set()
         term_lower = search_term.lower()
         
-        for organism in organisms:
+        for organism in organisms or []:
             name = organism.get('organism_name', '')
             sci_name = organism.get('scientific_name', '')
             
@@ -98,7 +224,7 @@ class OrganismFilter:
             if sci_name.lower().startswith(term_lower):
                 suggestions.add(sci_name)
         
-        return sorted(list(suggestions))[:10]
+        return sorted(list(suggestions))[:limit]
 
 
 class SearchHistory:
@@ -0,0 +1,240 @@
+"""
+In-Process Search Indexes
+Weighted inverted indexes over organisms (names, taxonomy, descriptions)
+and BioTube videos (titles, taxonomy, descriptions)
+"""
+
+import bisect
+import re
+import time
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Relative importance of each indexed field when ranking results
+FIELD_WEIGHTS = {
+    "name": 4.0,
+    "scientific_name": 3.0,
+    "classification": 2.0,
+    "description": 1.0,
+}
+
+# Fields to fetch from MongoDB when (re)building the index
+INDEX_PROJECTION = {"_id": 0, "id": 1, "name": 1, "scientific_name": 1, "classification": 1, "description": 1}
+
+# Video search weights; the taxonomy *_lc values double as filter attributes
+VIDEO_FIELD_WEIGHTS = {
+    "title": 4.0,
+    "species": 3.0,
+    "class_name": 2.0,
+    "phylum": 2.0,
+    "kingdom": 2.0,
+    "description": 1.0,
+}
+VIDEO_FILTER_FIELDS = ("visibility", "kingdom_lc", "phylum_lc", "class_name_lc", "species_lc")
+VIDEO_INDEX_PROJECTION = {
+    "_id": 0, "id": 1,
+    **{field: 1 for field in VIDEO_FIELD_WEIGHTS},
+    **{field: 1 for field in VIDEO_FILTER_FIELDS},
+}
+
+# A term that only matches a query token by prefix scores less than an exact match
+PREFIX_MATCH_FACTOR = 0.5
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_WORD_RE = re.compile(r"\w+")
+
+
+def fold_text(text: str) -> str:
+    """Lowercase and strip diacritics so 'É' and 'e' index the same way"""
+    normalized = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in normalized if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into folded alphanumeric tokens"""
+    return _TOKEN_RE.findall(fold_text(text))
+
+
+def highlight_offsets(text: str, query: str) -> List[Tuple[int, int]]:
+    """
+    [start, end) character offsets in the original text of words matching a
+    query token by prefix, the same way search() matches them.
+    """
+    tokens = set(tokenize(query))
+    if not text or not tokens:
+        return []
+    offsets = []
+    for match in _WORD_RE.finditer(text):
+        for word in tokenize(match.group()):
+            if any(word.startswith(token) for token in tokens):
+                offsets.append((match.start(), match.end()))
+                break
+    return offsets
+
+
+class WeightedSearchIndex:
+    """
+    Inverted index mapping tokens to document ids with per-field weights.
+    Defaults index organisms; other collections pass their own field weights,
+    title field and the attributes search() may filter on.
+    """
+
+    def __init__(
+        self,
+        max_age_seconds: float = 300,
+        field_weights: Optional[Dict[str, float]] = None,
+        title_field: str = "name",
+        filter_fields: Tuple[str, ...] = (),
+    ):
+        self.max_age_seconds = max_age_seconds
+        self.field_weights = field_weights or FIELD_WEIGHTS
+        self.title_field = title_field
+        self.filter_fields = filter_fields
+        self.built_at: Optional[float] = None
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._names: Dict[str, str] = {}
+        self._attributes: Dict[str, Dict[str, str]] = {}
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the index was never built or is older than max_age_seconds"""
+        if self.built_at is None:
+            return True
+        return time.monotonic() - self.built_at > self.max_age_seconds
+
+    def rebuild(self, organisms: Iterable[Dict]) -> int:
+        """Replace the whole index with the given organisms; returns the count indexed"""
+        self._postings = {}
+        self._doc_terms = {}
+        self._names = {}
+        self._attributes = {}
+        for organism in organisms:
+            self.add(organism)
+        self.built_at = time.monotonic()
+        return len(self._doc_terms)
+
+    def add(self, organism: Dict) -> None:
+        """Index an organism, replacing any previous entry with the same id"""
+        doc_id = organism.get("id")
+        if not doc_id:
+            return
+        self.remove(doc_id)
+
+        terms = self._extract_terms(organism)
+        for term, weight in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._vocabulary_dirty = True
+            postings[doc_id] = weight
+        self._doc_terms[doc_id] = terms
+        self._names[doc_id] = organism.get(self.title_field, "") or ""
+        if self.filter_fields:
+            self._attributes[doc_id] = {field: organism.get(field) for field in self.filter_fields}
+
+    def remove(self, doc_id: str) -> None:
+        """Drop an organism from the index if present"""
+        terms = self._doc_terms.pop(doc_id, None)
+        self._names.pop(doc_id, None)
+        self._attributes.pop(doc_id, None)
+        if not terms:
+            return
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                self._vocabulary_dirty = True
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> Tuple[List[str], int]:
+        """
+        Rank documents matching every token of `query` (each token may match a
+        term by prefix) and, if given, equal to every `filters` attribute.
+        Returns (ids for the requested page, total match count).
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return [], 0
+
+        scores: Optional[Dict[str, float]] = None
+        for token in tokens:
+            token_scores: Dict[str, float] = {}
+            for term in self._expand(token):
+                factor = 1.0 if term == token else PREFIX_MATCH_FACTOR
+                for doc_id, weight in self._postings[term].items():
+                    score = weight * factor
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {d: s + token_scores[d] for d, s in scores.items() if d in token_scores}
+            if not scores:
+                return [], 0
+
+        if filters:
+            scores = {
+                d: s for d, s in scores.items()
+                if all(self._attributes.get(d, {}).get(field) == value for field, value in filters.items())
+            }
+
+        folded_query = " ".join(tokens)
+        for doc_id in scores:
+            if " ".join(tokenize(self._names.get(doc_id, ""))) == folded_query:
+                scores[doc_id] += self.field_weights[self.title_field]
+
+        ranked = sorted(scores, key=lambda d: (-scores[d], self._names.get(d, "").lower(), d))
+        end = offset + limit if limit else None
+        return ranked[offset:end], len(ranked)
+
+    def _expand(self, token: str) -> List[str]:
+        """All indexed terms that start with token"""
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._postings)
+            self._vocabulary_dirty = False
+
+        start = bisect.bisect_left(self._vocabulary, token)
+        matches = []
+        for term in self._vocabulary[start:]:
+            if not term.startswith(token):
+                break
+            matches.append(term)
+        return matches
+
+    def _extract_terms(self, organism: Dict) -> Dict[str, float]:
+        """Map each token of the indexed fields to its highest field weight"""
+        terms: Dict[str, float] = {}
+        for field, weight in self.field_weights.items():
+            value = organism.get(field)
+            if isinstance(value, dict):
+                value = " ".join(str(v) for v in value.values() if v)
+            if not value:
+                continue
+            for token in tokenize(str(value)):
+                if weight > terms.get(token, 0.0):
+                    terms[token] = weight
+        return terms
+
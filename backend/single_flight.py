@@ -0,0 +1,63 @@
+"""
+Single-Flight Request Coalescing
+Concurrent callers asking for the same key share one in-flight computation,
+and its result is remembered briefly to absorb near-simultaneous retries
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from ttl_cache import TTLCache
+
+_MISSING = object()
+
+
+class SingleFlight:
+    """Per-key coalescing of async calls with a short-lived result memo"""
+
+    def __init__(self, memo_ttl: float = 30.0, memo_size: int = 256):
+        self.memo_ttl = memo_ttl
+        self._memo = TTLCache(maxsize=memo_size, ttl_seconds=memo_ttl) if memo_ttl > 0 else None
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return fn()'s result, running it at most once at a time per key.
+        Failures are shared by everyone waiting on that call but never memoized.
+        The computation keeps running if the caller that started it is cancelled,
+        so other waiters still get the result.
+        """
+        if self._memo is not None:
+            result = self._memo.get(key, _MISSING)
+            if result is not _MISSING:
+                self.coalesced += 1
+                return result
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(fn())
+        self._in_flight[key] = future
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def _finish(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if self._memo is not None and not future.cancelled() and future.exception() is None:
+            self._memo.set(key, future.result())
+
+    def forget(self, key: Hashable) -> None:
+        if self._memo is not None:
+            self._memo.pop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": len(self._in_flight),
+            "coalesced": self.coalesced,
+            "memo_size": len(self._memo) if self._memo is not None else 0,
+            "memo_ttl": self.memo_ttl,
+        }
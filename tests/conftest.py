@@ -0,0 +1,22 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+# The backend modules are imported as top-level modules, the same way server.py imports them
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+
+@pytest.fixture(scope="session")
+def server():
+    """The FastAPI app module; importing it needs MONGO_URL but does not connect"""
+    os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+    return importlib.import_module("server")
+
+
+@pytest.fixture
+def mongo():
+    """Fresh in-memory Motor database"""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    return mongomock_motor.AsyncMongoMockClient().db
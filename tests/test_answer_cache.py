@@ -0,0 +1,75 @@
+import asyncio
+
+from answer_cache import AnswerCache, normalize_question, question_key
+
+
+class BrokenCollection:
+    """Collection whose every call fails, like MongoDB being unreachable"""
+
+    async def find_one(self, *args, **kwargs):
+        raise ConnectionError("mongo down")
+
+    async def update_one(self, *args, **kwargs):
+        raise ConnectionError("mongo down")
+
+
+def test_normalize_question_folds_case_punctuation_and_whitespace():
+    assert normalize_question("  What is   DNA?! ") == "what is dna"
+    assert normalize_question("What's a cell") == "what s a cell"
+
+
+def test_normalize_question_keeps_non_latin_scripts():
+    assert normalize_question("डीएनए क्या है?") == "डीएनए क्या है"
+    assert normalize_question("Что такое ДНК?") == "что такое днк"
+    assert normalize_question("什么是DNA？") == "什么是dna"
+
+
+def test_non_latin_questions_get_distinct_keys():
+    keys = {question_key(q) for q in ["डीएनए क्या है?", "आरएनए क्या है?", "Что такое ДНК?", "Что такое РНК?"]}
+    assert None not in keys
+    assert len(keys) == 4
+
+
+def test_equivalent_questions_share_a_key():
+    assert question_key("What is DNA?") == question_key("what is dna")
+    assert question_key("ＤＮＡ とは") == question_key("DNA とは")
+
+
+def test_short_or_empty_questions_are_not_keyed():
+    for question in ["", "   ", "?!?", "hi", "a b"]:
+        assert question_key(question) is None
+
+
+def test_get_and_set_round_trip(mongo):
+    async def main():
+        cache = AnswerCache(mongo.ai_answers)
+        await cache.set("What is DNA?", {"answer": "A molecule"})
+        assert await cache.get("what is dna") == {"answer": "A molecule"}
+
+        # A fresh process reads it back from MongoDB
+        fresh = AnswerCache(mongo.ai_answers)
+        assert await fresh.get("WHAT IS DNA") == {"answer": "A molecule"}
+        assert fresh.stats()["db_hits"] == 1
+
+    asyncio.run(main())
+
+
+def test_short_questions_are_never_cached(mongo):
+    async def main():
+        cache = AnswerCache(mongo.ai_answers)
+        await cache.set("?", {"answer": "x"})
+        assert await cache.get("?") is None
+        assert await mongo.ai_answers.count_documents({}) == 0
+
+    asyncio.run(main())
+
+
+def test_database_errors_are_a_miss_not_a_failure():
+    async def main():
+        cache = AnswerCache(BrokenCollection())
+        assert await cache.get("What is DNA?") is None
+        await cache.set("What is DNA?", {"answer": "A molecule"})
+        # The hot tier still has the answer
+        assert await cache.get("What is DNA?") == {"answer": "A molecule"}
+
+    asyncio.run(main())
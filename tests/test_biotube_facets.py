@@ -0,0 +1,113 @@
+import asyncio
+import json
+
+from biotube_facets import TaxonomyFacets, video_path
+
+TIGER = {"id": "1", "kingdom": "Animalia", "phylum": "Chordata", "class_name": "Mammalia", "species": "tigris"}
+EAGLE = {"id": "2", "kingdom": "Animalia", "phylum": "Chordata", "class_name": "Aves", "species": ""}
+ROSE = {"id": "3", "kingdom": "Plantae", "phylum": "", "class_name": "", "species": ""}
+
+
+def document(facets):
+    body, _ = facets.render()
+    return json.loads(body)
+
+
+def test_video_path():
+    assert video_path({**TIGER, "visibility": "private"}) is None
+    assert video_path({"kingdom": " Animalia "}) == ("Animalia", "", "", "")
+
+
+def test_counts_after_rebuild():
+    facets = TaxonomyFacets()
+    assert facets.rebuild([TIGER, EAGLE, ROSE, {**TIGER, "id": "4", "visibility": "private"}]) == 3
+
+    doc = document(facets)
+    assert doc["total"] == 3
+    assert doc["counts"]["kingdom"] == {"Animalia": 2, "Plantae": 1}
+    assert doc["counts"]["class_name"] == {"Aves": 1, "Mammalia": 1}
+    assert doc["kingdoms"] == ["Animalia", "Plantae"]
+    assert doc["classes"] == ["Aves", "Mammalia"]
+
+
+def test_tree_counts_down_to_first_missing_rank():
+    facets = TaxonomyFacets()
+    facets.rebuild([TIGER, EAGLE, ROSE])
+    animalia, plantae = document(facets)["tree"]
+    assert (animalia["value"], animalia["count"]) == ("Animalia", 2)
+    chordata = animalia["children"][0]
+    assert [(c["value"], c["count"]) for c in chordata["children"]] == [("Aves", 1), ("Mammalia", 1)]
+    assert chordata["children"][0]["children"] == []
+    assert plantae == {"value": "Plantae", "count": 1, "children": []}
+
+
+def test_apply_updates_counts():
+    facets = TaxonomyFacets()
+    facets.rebuild([TIGER, EAGLE])
+
+    facets.apply({**EAGLE, "kingdom": "Plantae", "phylum": "", "class_name": ""})
+    doc = document(facets)
+    assert doc["counts"]["kingdom"] == {"Animalia": 1, "Plantae": 1}
+    assert doc["counts"]["class_name"] == {"Mammalia": 1}
+
+    facets.apply(ROSE)
+    assert document(facets)["counts"]["kingdom"] == {"Animalia": 1, "Plantae": 2}
+
+
+def test_apply_private_video_removes_it():
+    facets = TaxonomyFacets()
+    facets.rebuild([TIGER, EAGLE])
+    facets.apply({**TIGER, "visibility": "private"})
+    doc = document(facets)
+    assert doc["total"] == 1
+    assert doc["counts"]["species"] == {}
+
+
+def test_remove_updates_counts_and_etag():
+    facets = TaxonomyFacets()
+    facets.rebuild([TIGER, EAGLE])
+    _, etag = facets.render()
+
+    facets.remove("1")
+    facets.remove("missing")
+    doc = document(facets)
+    assert doc["total"] == 1
+    assert doc["counts"]["kingdom"] == {"Animalia": 1}
+    assert doc["counts"]["class_name"] == {"Aves": 1}
+    assert facets.render()[1] != etag
+
+    facets.apply(TIGER)
+    assert facets.render()[1] == etag
+
+
+def test_render_is_cached_until_a_change():
+    facets = TaxonomyFacets()
+    facets.rebuild([TIGER])
+    assert facets.render() is facets.render()
+    assert not facets.is_stale
+
+
+def test_stale_video_indexes_are_served_while_rebuilding_in_background(server, mongo, monkeypatch):
+    monkeypatch.setattr(server, "biotube_videos_collection", mongo.biotube_videos)
+    monkeypatch.setattr(server, "biotube_facets", TaxonomyFacets(max_age_seconds=60))
+    monkeypatch.setattr(server, "video_search_index", server.WeightedSearchIndex(
+        max_age_seconds=60, field_weights=server.VIDEO_FIELD_WEIGHTS,
+        title_field="title", filter_fields=server.VIDEO_FILTER_FIELDS))
+    monkeypatch.setattr(server, "video_indexes_lock", asyncio.Lock())
+    monkeypatch.setattr(server, "index_refresh_tasks", {})
+
+    async def main():
+        await mongo.biotube_videos.insert_one({**TIGER, "title": "Tiger hunt"})
+        await server.ensure_video_indexes_ready()
+        assert document(server.biotube_facets)["total"] == 1
+
+        await mongo.biotube_videos.insert_one({**ROSE, "title": "Rose garden"})
+        server.biotube_facets.built_at -= 120
+        await server.ensure_video_indexes_ready()
+        assert document(server.biotube_facets)["total"] == 1
+
+        await server.index_refresh_tasks["video"]
+        assert document(server.biotube_facets)["total"] == 2
+        assert len(server.video_search_index) == 2
+
+    asyncio.run(main())
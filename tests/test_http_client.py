@@ -0,0 +1,90 @@
+import asyncio
+
+import httpx
+import pytest
+
+import http_client
+from http_client import AsyncHTTPClient
+
+
+def make_client(monkeypatch, handler, **kwargs):
+    """Client whose requests go to handler; returns (client, list of backoff delays slept)"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(http_client.asyncio, "sleep", fake_sleep)
+    client = AsyncHTTPClient(**kwargs)
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, delays
+
+
+def test_retries_retryable_status_then_succeeds(monkeypatch):
+    statuses = iter([503, 502, 200])
+    client, delays = make_client(monkeypatch, lambda request: httpx.Response(next(statuses)), max_retries=2)
+
+    response = asyncio.run(client.get("https://api.example.org/x"))
+    assert response.status_code == 200
+    assert len(delays) == 2
+
+
+def test_returns_last_error_response_when_retries_run_out(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(500)
+
+    client, _ = make_client(monkeypatch, handler, max_retries=1)
+    assert asyncio.run(client.get("https://api.example.org/x")).status_code == 500
+    assert len(calls) == 2
+
+
+def test_client_errors_are_not_retried(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404)
+
+    client, delays = make_client(monkeypatch, handler)
+    assert asyncio.run(client.get("https://api.example.org/x")).status_code == 404
+    assert len(calls) == 1 and delays == []
+
+
+def test_retry_after_is_honoured_and_capped(monkeypatch):
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "3"}),
+        httpx.Response(429, headers={"Retry-After": "120"}),
+        httpx.Response(200),
+    ])
+    client, delays = make_client(monkeypatch, lambda request: next(responses), max_retries=2, backoff_max=8.0)
+
+    asyncio.run(client.get("https://api.example.org/x"))
+    assert delays == [3.0, 8.0]
+
+
+def test_exponential_backoff_with_jitter():
+    client = AsyncHTTPClient(backoff_base=1.0, backoff_max=5.0)
+    for attempt, full in [(1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0)]:
+        delay = client._backoff(attempt)
+        assert full / 2 <= delay <= full
+
+
+def test_transport_errors_are_retried_then_raised(monkeypatch):
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    client, delays = make_client(monkeypatch, handler, max_retries=2)
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(client.get("https://api.example.org/x"))
+    assert len(delays) == 2
+
+
+def test_per_host_semaphores():
+    client = AsyncHTTPClient(per_host_limit=3)
+    a = client._semaphore("https://API.example.org/a")
+    assert a is client._semaphore("https://api.example.org/b")
+    assert a is not client._semaphore("https://commons.wikimedia.org/")
+    assert a._value == 3
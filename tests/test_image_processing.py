@@ -0,0 +1,83 @@
+import asyncio
+import io
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from PIL import Image
+
+import image_processing
+from image_processing import ImageFetchError, downscale_image, prepare_for_vision
+
+
+def png_bytes(width, height):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "green").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_downscale_fits_longest_side_and_outputs_jpeg():
+    jpeg = downscale_image(png_bytes(1200, 600), max_side=300)
+    with Image.open(io.BytesIO(jpeg)) as img:
+        assert img.format == "JPEG"
+        assert img.size == (300, 150)
+
+
+def test_pixel_cap_rejects_before_decoding(monkeypatch):
+    monkeypatch.setattr(image_processing, "MAX_IMAGE_PIXELS", 100 * 100)
+    with pytest.raises(ImageFetchError, match="pixels"):
+        downscale_image(png_bytes(200, 100))
+
+
+def test_undecodable_bytes_raise_image_fetch_error():
+    async def main():
+        with pytest.raises(ImageFetchError):
+            await prepare_for_vision(b"not an image")
+
+    try:
+        asyncio.run(main())
+    finally:
+        image_processing.shutdown_image_workers()
+
+
+class BrokenPool:
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+class WorkingPool:
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+def test_broken_pool_is_replaced_and_the_call_retried(monkeypatch):
+    broken = BrokenPool()
+    pools = iter([broken, WorkingPool()])
+    monkeypatch.setattr(image_processing, "_process_pool", None)
+    monkeypatch.setattr(image_processing, "ProcessPoolExecutor", lambda max_workers: next(pools))
+
+    jpeg, mime = asyncio.run(prepare_for_vision(png_bytes(64, 64), max_side=32))
+    assert mime == "image/jpeg"
+    assert jpeg.startswith(b"\xff\xd8")
+    assert broken.shut_down
+    assert isinstance(image_processing._process_pool, WorkingPool)
+
+
+def test_pool_broken_twice_gives_up(monkeypatch):
+    monkeypatch.setattr(image_processing, "_process_pool", None)
+    monkeypatch.setattr(image_processing, "ProcessPoolExecutor", lambda max_workers: BrokenPool())
+
+    with pytest.raises(ImageFetchError, match="worker died"):
+        asyncio.run(prepare_for_vision(png_bytes(8, 8)))
+    assert image_processing._process_pool is None
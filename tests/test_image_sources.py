@@ -0,0 +1,155 @@
+import asyncio
+
+import pytest
+
+import image_sources
+from image_sources import (
+    CircuitBreaker,
+    ImageProvider,
+    ImageSourcingEngine,
+    ProviderUnavailableError,
+    RateLimiter,
+)
+from image_search_cache import ImageSearchCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(image_sources.time, "monotonic", fake)
+    return fake
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    clock.now += 60
+    assert breaker.state == "half-open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_failed_trial_reopens_the_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    clock.now += 60
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now += 59
+    assert not breaker.allow()
+
+
+def test_rate_limiter_refuses_when_the_wait_is_too_long(clock):
+    async def main():
+        limiter = RateLimiter(rate=2, per=60)
+        assert await limiter.acquire(max_wait=0)
+        assert await limiter.acquire(max_wait=0)
+        assert not await limiter.acquire(max_wait=0)
+
+        clock.now += 30
+        assert await limiter.acquire(max_wait=0)
+        assert not await limiter.acquire(max_wait=0)
+
+    asyncio.run(main())
+
+
+def test_rate_limiter_waits_for_a_token(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+        clock.now += delay
+
+    monkeypatch.setattr(image_sources.asyncio, "sleep", fake_sleep)
+
+    async def main():
+        limiter = RateLimiter(rate=1, per=1)
+        assert await limiter.acquire()
+        assert await limiter.acquire(max_wait=2)
+
+    asyncio.run(main())
+    assert slept == [pytest.approx(1.0)]
+
+
+class FakeProvider(ImageProvider):
+    def __init__(self, name, results=None, error=None, configured=True):
+        super().__init__(RateLimiter(100, 1), CircuitBreaker(failure_threshold=2))
+        self.name = name
+        self.results = results or {}
+        self.error = error
+        self.configured = configured
+        self.queries = []
+
+    def is_configured(self):
+        return self.configured
+
+    async def _search(self, query, count):
+        self.queries.append(query)
+        if self.error is not None:
+            raise self.error
+        return self.results.get(query.lower(), [])
+
+
+@pytest.fixture(autouse=True)
+def empty_search_cache(monkeypatch):
+    monkeypatch.setattr(image_sources, "image_search_cache", ImageSearchCache())
+
+
+def test_find_images_walks_terms_then_providers_without_duplicates():
+    unsplash = FakeProvider("unsplash", {"tiger": ["u1", "u2"]})
+    wikimedia = FakeProvider("wikimedia", {"tiger": ["u2", "w1"], "panthera tigris": ["w2", "w3"]})
+    engine = ImageSourcingEngine([unsplash, wikimedia])
+
+    images = asyncio.run(engine.find_images(["Tiger", "tiger ", "Panthera tigris"], 4, providers=("unsplash", "wikimedia")))
+    assert images == ["u1", "u2", "w1", "w2"]
+    # "tiger " normalizes to an already searched term
+    assert unsplash.queries == ["Tiger", "Panthera tigris"]
+
+
+def test_failing_provider_is_skipped_and_trips_its_breaker():
+    broken = FakeProvider("unsplash", error=ProviderUnavailableError("HTTP 500"))
+    wikimedia = FakeProvider("wikimedia", {"lion": ["w1"], "panthera leo": ["w2"]})
+    engine = ImageSourcingEngine([broken, wikimedia])
+
+    images = asyncio.run(engine.find_images(["lion", "panthera leo", "cat"], 5, providers=("unsplash", "wikimedia")))
+    assert images == ["w1", "w2"]
+    assert broken.queries == ["lion", "panthera leo"]
+    assert broken.breaker.state == "open"
+
+
+def test_configured_filters_and_keeps_order():
+    engine = ImageSourcingEngine([
+        FakeProvider("bing", configured=False),
+        FakeProvider("wikimedia"),
+        FakeProvider("unsplash"),
+    ])
+    assert engine.configured() == ("unsplash", "wikimedia")
+    assert engine.configured(("wikimedia", "missing")) == ("wikimedia",)
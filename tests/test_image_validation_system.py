@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import pytest
+
+import image_validation_system as ivs
+from llm_executor import LLMBusyError, LLMTimeoutError
+
+URLS = ["https://img/1.jpg", "https://img/2.jpg", "https://img/3.jpg"]
+
+
+class Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeExecutor:
+    """Answers batched prompts from batch_reply(image_count) and single-image prompts with a fixed verdict"""
+
+    def __init__(self, batch_reply=None, error=None):
+        self.batch_reply = batch_reply
+        self.error = error
+        self.calls = []
+
+    async def generate_content(self, model, contents):
+        images = sum(1 for part in contents if isinstance(part, dict))
+        self.calls.append(images)
+        if self.error is not None:
+            raise self.error
+        if images == 1:
+            return Response('{"is_organism": true, "confidence": 80, "reason": "single"}')
+        return Response(self.batch_reply(images))
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    """Installs a FakeExecutor and stubs out image download and downscaling"""
+    async def fetch(url):
+        return url.encode(), "image/jpeg"
+
+    async def prepare(data):
+        return data, "image/jpeg"
+
+    monkeypatch.setattr(ivs, "HAS_GENAI", True)
+    monkeypatch.setattr(ivs, "fetch_image_bytes", fetch)
+    monkeypatch.setattr(ivs, "prepare_for_vision", prepare)
+    monkeypatch.setattr(ivs, "verdict_cache", ivs.ValidationVerdictCache())
+
+    fake = FakeExecutor()
+    monkeypatch.setattr(ivs, "get_llm_executor", lambda: fake)
+    return fake
+
+
+def batch_json(count, skip=()):
+    return json.dumps([
+        {"image": i, "is_organism": True, "confidence": 90, "reason": "batch"}
+        for i in range(1, count + 1) if i not in skip
+    ])
+
+
+def validate(urls=URLS):
+    return asyncio.run(ivs.validate_images_batch(urls, "Tiger", "Panthera tigris"))
+
+
+def test_one_request_judges_the_whole_batch(executor):
+    executor.batch_reply = batch_json
+    verdicts = validate()
+    assert executor.calls == [3]
+    assert [verdicts[url]["reason"] for url in URLS] == ["batch"] * 3
+    assert all(verdicts[url]["is_valid"] for url in URLS)
+
+
+def test_images_missing_from_the_answer_are_judged_one_by_one(executor):
+    executor.batch_reply = lambda count: batch_json(count, skip={2})
+    verdicts = validate()
+    assert executor.calls == [3, 1]
+    assert verdicts[URLS[1]]["reason"] == "single"
+
+
+def test_unparseable_answer_falls_back_to_single_requests(executor):
+    executor.batch_reply = lambda count: "I cannot help with that"
+    verdicts = validate()
+    assert executor.calls == [3, 1, 1, 1]
+    assert all(verdicts[url]["reason"] == "single" for url in URLS)
+
+
+@pytest.mark.parametrize("error", [LLMBusyError("busy"), LLMTimeoutError("slow"), RuntimeError("api down")])
+def test_failed_call_marks_images_not_judged_without_retrying(executor, error):
+    executor.error = error
+    verdicts = validate()
+    assert executor.calls == [3]
+    for url in URLS:
+        assert verdicts[url]["is_valid"] is False
+        assert verdicts[url]["confidence"] == 0
+        assert verdicts[url]["judged"] is False
+
+
+def test_failed_single_image_call_is_not_judged(executor):
+    executor.error = LLMBusyError("busy")
+    [verdict] = validate(URLS[:1]).values()
+    assert (verdict["is_valid"], verdict["judged"]) == (False, False)
+
+
+def test_unjudged_images_are_not_cached(executor):
+    executor.error = LLMTimeoutError("slow")
+    validate()
+    executor.error = None
+    executor.batch_reply = batch_json
+    verdicts = validate()
+    assert executor.calls == [3, 3]
+    assert not any(verdicts[url]["cached"] for url in URLS)
+
+    cached = validate()
+    assert executor.calls == [3, 3]
+    assert all(cached[url]["cached"] for url in URLS)
@@ -0,0 +1,130 @@
+import asyncio
+from datetime import timedelta, timezone
+
+import pytest
+
+from job_queue import FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueue, PermanentJobError, _utcnow
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+def make_queue(**kwargs):
+    queue = JobQueue(collection=mongomock_motor.AsyncMongoMockClient().db.jobs, **kwargs)
+    queue.register("work", handler)
+    return queue
+
+
+async def handler(payload):
+    if payload.get("fail") == "permanent":
+        raise PermanentJobError("bad input")
+    if payload.get("fail"):
+        raise RuntimeError("try again")
+    return {"ok": payload.get("n")}
+
+
+def test_backoff_doubles_up_to_the_cap():
+    queue = JobQueue(backoff_base=5, backoff_max=30)
+    assert [queue._backoff(attempt) for attempt in range(1, 6)] == [5, 10, 20, 30, 30]
+    assert queue._backoff(0) == 5
+
+
+def test_enqueue_rejects_unknown_job_types():
+    with pytest.raises(ValueError):
+        asyncio.run(make_queue().enqueue("missing", {}))
+
+
+def test_claim_takes_oldest_due_job_once():
+    async def main():
+        queue = make_queue()
+        first = await queue.enqueue("work", {"n": 1})
+        await queue.enqueue("work", {"n": 2})
+        await queue.enqueue("work", {"n": 3}, delay_seconds=60)
+
+        claimed = [await queue._claim(), await queue._claim(), await queue._claim()]
+        assert claimed[0]["id"] == first["id"]
+        assert claimed[0]["status"] == RUNNING
+        assert claimed[0]["attempts"] == 1
+        assert claimed[0]["locked_by"] == queue.worker_id
+        assert [job["payload"]["n"] for job in claimed[:2]] == [1, 2]
+        assert claimed[2] is None
+
+    asyncio.run(main())
+
+
+def test_claim_recovers_job_with_expired_lease():
+    async def main():
+        queue = make_queue()
+        job = await queue.enqueue("work", {"n": 1})
+        await queue._claim()
+        assert await queue._claim() is None
+
+        await queue.collection.update_one({"id": job["id"]}, {"$set": {"locked_until": _utcnow() - timedelta(seconds=1)}})
+        reclaimed = await queue._claim()
+        assert reclaimed["id"] == job["id"]
+        assert reclaimed["attempts"] == 2
+
+    asyncio.run(main())
+
+
+def test_failed_attempt_is_requeued_with_backoff_then_fails():
+    async def main():
+        queue = make_queue(backoff_base=10)
+        job = await queue.enqueue("work", {"fail": True}, max_attempts=2)
+
+        await queue._execute(await queue._claim())
+        stored = await queue.get(job["id"])
+        assert stored["status"] == QUEUED
+        assert stored["error"] == "try again"
+        # MongoDB hands datetimes back without tzinfo (UTC)
+        delay = (stored["run_after"].replace(tzinfo=timezone.utc) - _utcnow()).total_seconds()
+        assert 8 < delay <= 10
+        assert await queue._claim() is None
+
+        await queue.collection.update_one({"id": job["id"]}, {"$set": {"run_after": _utcnow()}})
+        await queue._execute(await queue._claim())
+        assert (await queue.get(job["id"]))["status"] == FAILED
+
+    asyncio.run(main())
+
+
+def test_permanent_error_fails_without_retry():
+    async def main():
+        queue = make_queue()
+        job = await queue.enqueue("work", {"fail": "permanent"})
+        await queue._execute(await queue._claim())
+        stored = await queue.get(job["id"])
+        assert (stored["status"], stored["attempts"], stored["error"]) == (FAILED, 1, "bad input")
+
+    asyncio.run(main())
+
+
+def test_idempotency_key_reuses_pending_and_recent_jobs():
+    async def main():
+        queue = make_queue()
+        first = await queue.enqueue("work", {"n": 1}, idempotency_key="k")
+        assert (await queue.enqueue("work", {"n": 1}, idempotency_key="k"))["id"] == first["id"]
+
+        await queue._execute(await queue._claim())
+        done = await queue.enqueue("work", {"n": 1}, idempotency_key="k")
+        assert done["id"] == first["id"]
+        assert done["status"] == SUCCEEDED
+
+        queue.idempotency_window = 0
+        assert (await queue.enqueue("work", {"n": 1}, idempotency_key="k"))["id"] != first["id"]
+
+    asyncio.run(main())
+
+
+def test_coalesce_key_only_merges_queued_jobs():
+    async def main():
+        queue = make_queue()
+        first = await queue.enqueue("work", {"n": 1}, coalesce_key="c", delay_seconds=5)
+        assert (await queue.enqueue("work", {"n": 1}, coalesce_key="c"))["id"] == first["id"]
+        assert (first["run_after"] - first["created_at"]).total_seconds() == 5
+
+        await queue.collection.update_one({"id": first["id"]}, {"$set": {"run_after": _utcnow()}})
+        claimed = await queue._claim()
+        assert "coalesce_key" not in claimed
+        assert (await queue.enqueue("work", {"n": 1}, coalesce_key="c"))["id"] != first["id"]
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+import asyncio
+import threading
+
+import pytest
+
+from llm_executor import LLMBusyError, LLMExecutor, LLMTimeoutError
+
+
+def test_run_returns_the_result_off_the_event_loop():
+    async def main():
+        executor = LLMExecutor(max_concurrency=2)
+        loop_thread = threading.get_ident()
+        result = await executor.run(lambda x: (x * 2, threading.get_ident()), 21)
+        executor.shutdown()
+        return result, loop_thread
+
+    (value, worker_thread), loop_thread = asyncio.run(main())
+    assert value == 42
+    assert worker_thread != loop_thread
+
+
+def test_exceptions_propagate_and_release_the_permit():
+    def fail():
+        raise ValueError("bad prompt")
+
+    async def main():
+        executor = LLMExecutor(max_concurrency=1)
+        with pytest.raises(ValueError):
+            await executor.run(fail)
+        await asyncio.sleep(0.01)
+        assert executor.in_flight == 0
+        assert await executor.run(lambda: "ok") == "ok"
+        executor.shutdown()
+
+    asyncio.run(main())
+
+
+def test_timed_out_call_keeps_its_permit_until_the_thread_finishes():
+    release = threading.Event()
+
+    async def main():
+        executor = LLMExecutor(max_concurrency=1)
+        with pytest.raises(LLMTimeoutError):
+            await executor.run(release.wait, timeout=0.05)
+
+        # The worker thread is still busy, so its permit is still taken
+        assert executor.in_flight == 1
+        with pytest.raises(LLMTimeoutError):
+            await executor.run(lambda: "queued", timeout=0.05)
+
+        release.set()
+        for _ in range(100):
+            if executor.in_flight == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert executor.in_flight == 0
+        assert await executor.run(lambda: "next", timeout=1) == "next"
+        executor.shutdown()
+
+    asyncio.run(main())
+
+
+def test_full_queue_raises_busy():
+    release = threading.Event()
+
+    async def main():
+        executor = LLMExecutor(max_concurrency=1, max_queue=1)
+        running = asyncio.ensure_future(executor.run(release.wait, timeout=5))
+        await asyncio.sleep(0.01)
+        waiting = asyncio.ensure_future(executor.run(lambda: "second", timeout=5))
+        await asyncio.sleep(0.01)
+        assert executor.waiting == 1
+
+        with pytest.raises(LLMBusyError):
+            await executor.run(lambda: "third", timeout=5)
+
+        release.set()
+        assert await running is True
+        assert await waiting == "second"
+        executor.shutdown()
+
+    asyncio.run(main())
@@ -0,0 +1,63 @@
+from name_similarity import NameSimilarityIndex, edit_distance, similarity, trigrams
+
+ORGANISMS = [
+    {"id": "1", "name": "Bengal Tiger", "scientific_name": "Panthera tigris tigris"},
+    {"id": "2", "name": "Lion", "scientific_name": "Panthera leo"},
+    {"id": "3", "name": "Snow Leopard", "scientific_name": "Panthera uncia"},
+]
+
+
+def test_edit_distance():
+    assert edit_distance("", "abc") == 3
+    assert edit_distance("kitten", "sitting") == 3
+    assert edit_distance("tiger", "tiger") == 0
+    assert edit_distance("tigirs", "tigris") == edit_distance("tigris", "tigirs")
+
+
+def test_similarity_bounds():
+    assert similarity("tiger", "tiger") == 1.0
+    assert similarity("", "") == 0.0
+    assert similarity("abc", "xyz") == 0.0
+
+
+def test_trigrams_are_padded():
+    assert trigrams("ab") == {"  a", " ab", "ab "}
+
+
+def test_similar_finds_misspellings_by_common_and_scientific_name():
+    index = NameSimilarityIndex()
+    assert index.rebuild(ORGANISMS) == 3
+
+    [match] = index.similar("Bengal Tigers", limit=5)
+    assert match["id"] == "1"
+    assert match["matched_field"] == "name"
+    assert 0.9 < match["score"] < 1.0
+
+    [match] = index.similar("panthera  LEÓ", limit=1)
+    assert match == {
+        "id": "2", "name": "Lion", "matched_field": "scientific_name",
+        "matched_value": "Panthera leo", "score": 1.0,
+    }
+
+
+def test_similar_respects_min_score_and_limit():
+    index = NameSimilarityIndex()
+    index.rebuild(ORGANISMS)
+    assert index.similar("Giraffe") == []
+    assert index.similar("") == []
+    assert len(index.similar("Panthera", limit=2, min_score=0.0)) <= 2
+
+
+def test_add_and_remove_update_the_index():
+    index = NameSimilarityIndex()
+    index.rebuild(ORGANISMS)
+
+    index.add({"id": "2", "name": "African Lion", "scientific_name": ""})
+    assert len(index) == 3
+    assert index.similar("Panthera leo", min_score=0.9) == []
+    assert index.similar("African Lion")[0]["id"] == "2"
+
+    index.remove("2")
+    assert len(index) == 2
+    assert index.similar("African Lion") == []
+    index.remove("missing")
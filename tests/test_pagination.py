@@ -0,0 +1,80 @@
+import pytest
+
+from pagination import (
+    InvalidCursorError,
+    build_keyset_query,
+    build_projection,
+    decode_cursor,
+    encode_cursor,
+    keyset_sort,
+    split_page,
+)
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor("2024-05-01T10:00:00+05:30", "abc-123")
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("2024-05-01T10:00:00+05:30", "abc-123")
+
+
+def test_cursor_round_trip_non_ascii():
+    cursor = encode_cursor("2024-05-01", "ñandú")
+    assert decode_cursor(cursor) == ("2024-05-01", "ñandú")
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", "e30", "bnVsbA", "!!!!"])
+def test_invalid_cursors_raise(cursor):
+    # "e30" is {} and "bnVsbA" is null: valid base64 JSON without the cursor keys
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+def test_invalid_cursor_is_a_value_error():
+    with pytest.raises(ValueError):
+        build_keyset_query({}, "garbage")
+
+
+def test_keyset_query_without_cursor_copies_base_query():
+    base = {"visibility": "public"}
+    query = build_keyset_query(base, None)
+    assert query == base
+    assert query is not base
+
+
+def test_keyset_query_ascending():
+    query = build_keyset_query({}, encode_cursor("2024-01-01", "b"))
+    assert query == {
+        "$or": [
+            {"created_at": {"$gt": "2024-01-01"}},
+            {"created_at": "2024-01-01", "id": {"$gt": "b"}},
+        ]
+    }
+
+
+def test_keyset_query_descending_combines_with_base_query():
+    query = build_keyset_query({"visibility": "public"}, encode_cursor("2024-01-01", "b"), descending=True)
+    assert query["$and"][0] == {"visibility": "public"}
+    assert query["$and"][1]["$or"][0] == {"created_at": {"$lt": "2024-01-01"}}
+    assert keyset_sort(descending=True) == [("created_at", -1), ("id", -1)]
+
+
+def test_split_page_returns_cursor_of_last_item():
+    docs = [{"id": str(i), "created_at": f"2024-01-0{i}"} for i in range(1, 5)]
+    page, cursor = split_page(docs, 3)
+    assert [d["id"] for d in page] == ["1", "2", "3"]
+    assert decode_cursor(cursor) == ("2024-01-03", "3")
+
+
+def test_split_page_last_page_has_no_cursor():
+    docs = [{"id": "1", "created_at": "2024-01-01"}]
+    assert split_page(docs, 3) == (docs, None)
+    assert split_page(docs, None) == (docs, None)
+
+
+def test_build_projection():
+    assert build_projection(None, ["name"]) is None
+    assert build_projection("name, images", ["name", "images"]) == {
+        "_id": 0, "id": 1, "created_at": 1, "name": 1, "images": 1,
+    }
+    with pytest.raises(ValueError):
+        build_projection("name,password", ["name"])
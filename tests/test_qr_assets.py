@@ -0,0 +1,110 @@
+import asyncio
+import base64
+
+from qr_assets import QRAssetStore, asset_id_for_url, asset_url, decode_data_uri, render_qr_png
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def test_asset_id_is_stable_per_url_and_rendering():
+    assert asset_id_for_url("https://x/organism/1") == asset_id_for_url("https://x/organism/1")
+    assert asset_id_for_url("https://x/organism/1") != asset_id_for_url("https://x/organism/2")
+    assert asset_id_for_url("https://x/organism/1") != asset_id_for_url("https://x/organism/1", box_size=4)
+
+
+def test_asset_url():
+    assert asset_url("abc", "https://api.example.org/") == "https://api.example.org/api/qr/abc.png"
+
+
+def test_decode_data_uri():
+    png = render_qr_png("https://x")
+    assert png.startswith(PNG_SIGNATURE)
+    encoded = base64.b64encode(png).decode()
+    assert decode_data_uri(f"data:image/png;base64,{encoded}") == png
+    assert decode_data_uri(encoded) == png
+    assert decode_data_uri("data:image/png;base64,@@@") is None
+    assert decode_data_uri(None) is None
+
+
+def test_ensure_renders_once_and_get_returns_the_png(mongo):
+    async def main():
+        store = QRAssetStore(mongo.qr_assets)
+        asset_id = await store.ensure("https://x/organism/1")
+        assert await store.ensure("https://x/organism/1") == asset_id
+        assert await mongo.qr_assets.count_documents({}) == 1
+
+        # A new process starts with an empty read cache
+        fresh = QRAssetStore(mongo.qr_assets)
+        assert await fresh.ensure("https://x/organism/1") == asset_id
+        asset = await fresh.get(asset_id)
+        assert asset["png"].startswith(PNG_SIGNATURE)
+        assert asset["etag"].startswith('"') and asset["target_url"] == "https://x/organism/1"
+        assert await fresh.get("missing") is None
+
+    asyncio.run(main())
+
+
+def test_store_png_is_content_addressed(mongo):
+    async def main():
+        store = QRAssetStore(mongo.qr_assets)
+        png = render_qr_png("https://x")
+        assert await store.store_png(png) == await store.store_png(png)
+        assert await mongo.qr_assets.count_documents({}) == 1
+
+    asyncio.run(main())
+
+
+def test_read_cache_is_bounded(mongo):
+    async def main():
+        store = QRAssetStore(mongo.qr_assets, cache_size=2)
+        for i in range(3):
+            await store.ensure(f"https://x/organism/{i}")
+        assert len(store._cache) == 2
+
+    asyncio.run(main())
+
+
+def test_etag_matches(server):
+    assert server.etag_matches('"abc"', '"abc"')
+    assert server.etag_matches('"x", W/"abc"', '"abc"')
+    assert server.etag_matches("*", '"abc"')
+    assert not server.etag_matches('"x"', '"abc"')
+    assert not server.etag_matches(None, '"abc"')
+
+
+def test_qr_endpoint_answers_304_for_a_matching_etag(server, mongo, monkeypatch):
+    monkeypatch.setattr(server, "qr_asset_store", QRAssetStore(mongo.qr_assets))
+
+    async def main():
+        asset_id = await server.qr_asset_store.ensure("https://x/organism/1")
+        asset = await server.qr_asset_store.get(asset_id)
+
+        full = await server.get_qr_asset(asset_id, if_none_match=None)
+        assert full.status_code == 200
+        assert full.body == asset["png"]
+        assert full.headers["etag"] == asset["etag"]
+        assert "immutable" in full.headers["cache-control"]
+
+        cached = await server.get_qr_asset(asset_id, if_none_match=asset["etag"])
+        assert cached.status_code == 304
+        assert cached.body == b""
+
+    asyncio.run(main())
+
+
+def test_public_base_url_honours_forwarded_proto(server, monkeypatch):
+    from starlette.requests import Request
+
+    def request(headers):
+        return Request({
+            "type": "http", "scheme": "http", "server": ("internal", 8000), "path": "/", "root_path": "",
+            "query_string": b"", "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+        })
+
+    monkeypatch.setattr(server, "PUBLIC_API_URL", None)
+    assert server.public_base_url(request({"host": "internal:8000"})) == "http://internal:8000/"
+    forwarded = {"host": "internal:8000", "x-forwarded-proto": "https", "x-forwarded-host": "api.example.org"}
+    assert server.public_base_url(request(forwarded)) == "https://api.example.org/"
+
+    monkeypatch.setattr(server, "PUBLIC_API_URL", "https://configured.example.org")
+    assert server.public_base_url(request(forwarded)) == "https://configured.example.org"
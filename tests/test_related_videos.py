@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from related_videos import CARD_FIELDS, ENGAGEMENT_WEIGHT, rank_related, taxonomic_closeness
+
+
+def video(video_id, kingdom="animalia", phylum="chordata", class_name="mammalia", species="", created_at="2024-01-01"):
+    return {
+        "id": video_id, "title": video_id, "created_at": created_at,
+        "kingdom_lc": kingdom, "phylum_lc": phylum, "class_name_lc": class_name, "species_lc": species,
+    }
+
+
+TIGER = video("tiger", species="tigris")
+TIGER_2 = video("tiger-2", species="tigris")
+LION = video("lion", species="leo")
+EAGLE = video("eagle", class_name="aves")
+ANT = video("ant", phylum="arthropoda", class_name="insecta")
+ROSE = video("rose", kingdom="plantae", phylum="tracheophyta", class_name="magnoliopsida")
+
+
+def test_taxonomic_closeness_uses_deepest_shared_rank():
+    assert taxonomic_closeness(TIGER, TIGER_2) == 4.0
+    assert taxonomic_closeness(TIGER, LION) == 3.0
+    assert taxonomic_closeness(TIGER, EAGLE) == 2.0
+    assert taxonomic_closeness(TIGER, ANT) == 1.0
+    assert taxonomic_closeness(TIGER, ROSE) == 0.0
+
+
+def test_rank_orders_by_closeness_and_skips_self_and_other_kingdoms():
+    candidates = [ROSE, ANT, EAGLE, LION, TIGER_2, TIGER]
+    related = rank_related(TIGER, candidates, {}, limit=10)
+    assert [r["id"] for r in related] == ["tiger-2", "lion", "eagle", "ant"]
+    assert [r["score"] for r in related] == [4.0, 3.0, 2.0, 1.0]
+    assert set(related[0]) == set(CARD_FIELDS) | {"score"}
+
+
+def test_engagement_orders_within_a_rank_but_not_across_ranks():
+    lion_2 = video("lion-2", species="leo")
+    engagement = {"lion-2": 50, "lion": 1, "ant": 1000}
+    related = rank_related(TIGER, [ANT, LION, lion_2, TIGER_2], engagement, limit=10)
+
+    assert [r["id"] for r in related] == ["tiger-2", "lion-2", "lion", "ant"]
+    assert related[-1]["score"] == 1.0 + ENGAGEMENT_WEIGHT
+    assert related[-1]["score"] < related[-2]["score"]
+
+
+def test_ties_break_on_newest_first_and_limit_applies():
+    older = video("older", species="leo", created_at="2023-01-01")
+    newer = video("newer", species="leo", created_at="2024-06-01")
+    related = rank_related(TIGER, [older, newer, EAGLE], {}, limit=2)
+    assert [r["id"] for r in related] == ["newer", "older"]
+
+
+def test_no_candidates():
+    assert rank_related(TIGER, [TIGER], {"tiger": 5}, limit=5) == []
+
+
+def test_comment_like_schedules_a_coalesced_delayed_refresh(server, mongo, monkeypatch):
+    monkeypatch.setattr(server, "video_comments_collection", mongo.video_comments)
+    monkeypatch.setattr(server, "biotube_videos_collection", mongo.biotube_videos)
+    scheduled = []
+
+    async def schedule(kingdoms, **kwargs):
+        scheduled.append((kingdoms, kwargs))
+
+    monkeypatch.setattr(server, "schedule_related_refresh", schedule)
+
+    async def main():
+        await mongo.biotube_videos.insert_one(dict(TIGER))
+        await mongo.video_comments.insert_one({"id": "c1", "video_id": "tiger", "likes": 0})
+        await server.like_video_comment("c1")
+        await server.like_video_comment("c1")
+        assert (await mongo.video_comments.find_one({"id": "c1"}))["likes"] == 2
+
+        with pytest.raises(HTTPException) as missing:
+            await server.like_video_comment("nope")
+        assert missing.value.status_code == 404
+
+    asyncio.run(main())
+    expected = (["animalia"], {"coalesce_key": "related-videos:animalia", "delay_seconds": server.RELATED_REFRESH_DELAY_SECONDS})
+    assert scheduled == [expected, expected]
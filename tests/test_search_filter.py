@@ -0,0 +1,75 @@
+import asyncio
+
+from search_filter import NamePrefixIndex, OrganismFilter
+
+ORGANISMS = [
+    {"id": "1", "name": "Tiger", "scientific_name": "Panthera tigris"},
+    {"id": "2", "name": "Tiger Shark", "scientific_name": "Galeocerdo cuvier"},
+    {"id": "3", "name": "Émeu", "scientific_name": "Dromaius novaehollandiae"},
+    {"id": "4", "name": "Panda", "scientific_name": "Ailuropoda melanoleuca"},
+]
+
+
+def build():
+    index = NamePrefixIndex()
+    index.rebuild(ORGANISMS)
+    return index
+
+
+def test_suggest_common_and_scientific_names_alphabetically():
+    index = build()
+    assert len(index) == 4
+    assert index.suggest("ti") == ["Tiger", "Tiger Shark"]
+    assert index.suggest("pan") == ["Panda", "Panthera tigris"]
+
+
+def test_suggest_ignores_case_and_accents():
+    assert build().suggest("EMEU") == ["Émeu"]
+
+
+def test_suggest_limit_and_empty_prefix():
+    index = build()
+    assert index.suggest("ti", limit=1) == ["Tiger"]
+    assert index.suggest("  ") == []
+    assert index.suggest("zebra") == []
+
+
+def test_add_replaces_and_remove_drops_names():
+    index = build()
+    index.add({"id": "1", "name": "Bengal Tiger", "scientific_name": "Panthera tigris tigris"})
+    assert index.suggest("ti") == ["Tiger Shark"]
+    assert index.suggest("beng") == ["Bengal Tiger"]
+
+    index.remove("2")
+    index.remove("missing")
+    assert index.suggest("ti") == []
+    assert len(index) == 3
+
+
+def test_get_search_suggestions_uses_the_index():
+    assert OrganismFilter.get_search_suggestions("ti", index=build(), limit=5) == ["Tiger", "Tiger Shark"]
+
+
+def test_stale_index_is_served_while_rebuilding_in_background(server, mongo, monkeypatch):
+    monkeypatch.setattr(server, "organisms_collection", mongo.organisms)
+    monkeypatch.setattr(server, "organism_name_index", NamePrefixIndex())
+    monkeypatch.setattr(server, "organism_search_index", server.WeightedSearchIndex(max_age_seconds=60))
+    monkeypatch.setattr(server, "organism_similarity_index", server.NameSimilarityIndex())
+    monkeypatch.setattr(server, "search_index_lock", asyncio.Lock())
+    monkeypatch.setattr(server, "index_refresh_tasks", {})
+
+    async def main():
+        await mongo.organisms.insert_one({"id": "1", "name": "Tiger"})
+        await server.ensure_search_index_ready()
+        assert server.organism_name_index.suggest("ti") == ["Tiger"]
+
+        await mongo.organisms.insert_one({"id": "2", "name": "Tilapia"})
+        server.organism_search_index.built_at -= 120
+        await server.ensure_search_index_ready()
+        assert server.organism_name_index.suggest("ti") == ["Tiger"]
+
+        await server.index_refresh_tasks["organism search"]
+        assert server.organism_name_index.suggest("ti") == ["Tiger", "Tilapia"]
+        assert not server.organism_search_index.is_stale
+
+    asyncio.run(main())
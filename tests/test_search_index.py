@@ -0,0 +1,112 @@
+import time
+
+from search_index import (
+    VIDEO_FIELD_WEIGHTS,
+    VIDEO_FILTER_FIELDS,
+    WeightedSearchIndex,
+    highlight_offsets,
+    tokenize,
+)
+
+ORGANISMS = [
+    {"id": "1", "name": "Tiger", "scientific_name": "Panthera tigris",
+     "classification": {"kingdom": "Animalia", "family": "Felidae"}, "description": "Large striped cat"},
+    {"id": "2", "name": "Tiger Shark", "scientific_name": "Galeocerdo cuvier",
+     "classification": {"kingdom": "Animalia"}, "description": "Shark with tiger-like stripes"},
+    {"id": "3", "name": "Tiger Lily", "scientific_name": "Lilium lancifolium",
+     "classification": {"kingdom": "Plantae"}, "description": "Orange flower"},
+    {"id": "4", "name": "Jaguar", "scientific_name": "Panthera onca",
+     "classification": {"kingdom": "Animalia", "family": "Felidae"}, "description": "Big cat of the Americas"},
+]
+
+
+def build(docs=ORGANISMS, **kwargs):
+    index = WeightedSearchIndex(**kwargs)
+    index.rebuild(docs)
+    return index
+
+
+def test_tokenize_folds_accents_and_case():
+    assert tokenize("Ñandú, RHEA-americana") == ["nandu", "rhea", "americana"]
+
+
+def test_exact_title_match_ranks_first():
+    ids, total = build().search("tiger")
+    assert total == 3
+    assert ids[0] == "1"
+    assert set(ids) == {"1", "2", "3"}
+
+
+def test_matches_scientific_name_and_classification():
+    ids, _ = build().search("panthera cat")
+    assert set(ids) == {"1", "4"}
+    ids, _ = build().search("felidae")
+    assert set(ids) == {"1", "4"}
+
+
+def test_name_match_outranks_description_match():
+    assert build().search("shark")[0] == ["2"]
+    docs = ORGANISMS + [{"id": "5", "name": "Reef fish", "description": "Hunted by the tiger shark"}]
+    ids, _ = build(docs).search("shark")
+    assert ids == ["2", "5"]
+
+
+def test_every_token_must_match_by_prefix():
+    ids, total = build().search("tig shar")
+    assert (ids, total) == (["2"], 1)
+    assert build().search("tiger zebra") == ([], 0)
+    assert build().search("  ") == ([], 0)
+
+
+def test_paging_keeps_total():
+    index = build()
+    first, total = index.search("tiger", limit=2)
+    second, _ = index.search("tiger", limit=2, offset=2)
+    assert total == 3
+    assert len(first) == 2 and len(second) == 1
+    assert not set(first) & set(second)
+
+
+def test_add_and_remove():
+    index = build()
+    index.add({"id": "5", "name": "Tigerfish", "description": ""})
+    assert "5" in index.search("tiger")[0]
+
+    index.add({"id": "1", "name": "Bengal", "scientific_name": "Panthera tigris"})
+    ids, _ = index.search("tiger")
+    assert "1" not in ids
+    assert "1" in index.search("tigris")[0]
+
+    index.remove("5")
+    index.remove("missing")
+    assert "5" not in index.search("tiger")[0]
+    assert len(index) == 4
+
+
+def test_staleness(monkeypatch):
+    index = WeightedSearchIndex(max_age_seconds=60)
+    assert index.is_stale
+    index.rebuild(ORGANISMS)
+    assert not index.is_stale
+    built_at = index.built_at
+    monkeypatch.setattr(time, "monotonic", lambda: built_at + 61)
+    assert index.is_stale
+
+
+def test_video_index_filters_and_title_field():
+    videos = [
+        {"id": "a", "title": "Tiger hunt", "kingdom": "Animalia", "visibility": "public", "kingdom_lc": "animalia"},
+        {"id": "b", "title": "Tiger lily timelapse", "kingdom": "Plantae", "visibility": "public", "kingdom_lc": "plantae"},
+        {"id": "c", "title": "Tiger cubs", "kingdom": "Animalia", "visibility": "private", "kingdom_lc": "animalia"},
+    ]
+    index = build(videos, field_weights=VIDEO_FIELD_WEIGHTS, title_field="title", filter_fields=VIDEO_FILTER_FIELDS)
+    ids, total = index.search("tiger", filters={"visibility": "public"})
+    assert total == 2 and set(ids) == {"a", "b"}
+    assert index.search("tiger", filters={"visibility": "public", "kingdom_lc": "plantae"}) == (["b"], 1)
+
+
+def test_highlight_offsets():
+    text = "The Tiger-lily and tigers"
+    assert highlight_offsets(text, "tig") == [(4, 9), (19, 25)]
+    assert highlight_offsets(text, "") == []
+    assert highlight_offsets("", "tiger") == []
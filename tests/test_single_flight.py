@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_computation():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        flight = SingleFlight(memo_ttl=0)
+        results = await asyncio.gather(*(flight.do("key", compute) for _ in range(5)))
+        return flight, results
+
+    flight, results = asyncio.run(main())
+    assert results == ["result"] * 5
+    assert len(calls) == 1
+    assert flight.coalesced == 4
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_different_keys_run_separately():
+    calls = []
+
+    async def main():
+        flight = SingleFlight(memo_ttl=0)
+
+        async def compute(key):
+            calls.append(key)
+            return key
+
+        return await asyncio.gather(flight.do("a", lambda: compute("a")), flight.do("b", lambda: compute("b")))
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+def test_result_is_memoized_until_forgotten():
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return len(calls)
+
+    async def main():
+        flight = SingleFlight(memo_ttl=30)
+        first = await flight.do("key", compute)
+        second = await flight.do("key", compute)
+        flight.forget("key")
+        third = await flight.do("key", compute)
+        return first, second, third
+
+    assert asyncio.run(main()) == (1, 1, 2)
+
+
+def test_failures_are_shared_but_not_memoized():
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def main():
+        flight = SingleFlight(memo_ttl=30)
+        results = await asyncio.gather(flight.do("key", fail), flight.do("key", fail), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(calls) == 1
+        with pytest.raises(RuntimeError):
+            await flight.do("key", fail)
+
+    asyncio.run(main())
+    assert len(calls) == 2
+
+
+def test_cancelled_caller_does_not_cancel_other_waiters():
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def main():
+        flight = SingleFlight(memo_ttl=0)
+        first = asyncio.ensure_future(flight.do("key", slow))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(flight.do("key", slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "done"
@@ -0,0 +1,74 @@
+import ttl_cache
+from ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(monkeypatch, **kwargs):
+    clock = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", clock)
+    return TTLCache(**kwargs), clock
+
+
+def test_get_and_miss_counters(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b", "default") == "default"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    cache, clock = make_cache(monkeypatch, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=60)
+
+    clock.now += 10
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_lru_eviction_drops_least_recently_used(monkeypatch):
+    cache, _ = make_cache(monkeypatch, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_overwrite_refreshes_position_and_expiry(monkeypatch):
+    cache, clock = make_cache(monkeypatch, maxsize=2, ttl_seconds=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    clock.now += 5
+    cache.set("a", 10)
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    clock.now += 6
+    assert cache.get("a") == 10
+
+
+def test_pop_and_clear(monkeypatch):
+    cache, _ = make_cache(monkeypatch)
+    cache.set("a", 1)
+    assert cache.pop("a") == 1
+    assert cache.pop("a", "gone") == "gone"
+    cache.set("b", 2)
+    cache.clear()
+    assert len(cache) == 0